@@ -13,14 +13,13 @@ from llamacontroller.db import crud
 def main():
     db = SessionLocal()
     try:
-        # Get all users
-        from llamacontroller.db.models import User
-        users = db.query(User).all()
+        # Get all users with their tokens (2 queries instead of 1 + N)
+        users = crud.get_users(db, limit=None, load_tokens=True)
         
         print("=== Users and their API Tokens ===\n")
         for user in users:
             print(f"User: {user.username} (ID: {user.id})")
-            tokens = crud.get_user_api_tokens(db, user.id)
+            tokens = user.api_tokens
             
             if tokens:
                 for token in tokens:
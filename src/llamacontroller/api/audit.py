@@ -0,0 +1,57 @@
+"""
+Audit log API endpoints (admin only)
+"""
+from typing import Iterator, Optional
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+
+from llamacontroller.auth.dependencies import require_admin
+from llamacontroller.db import crud
+from llamacontroller.db.base import SessionLocal
+from llamacontroller.db.models import User
+from llamacontroller.models.auth import AuditLogResponse
+
+router = APIRouter(prefix="/api/v1/audit-logs", tags=["Audit Logs"])
+
+
+def _export_lines(user_id: Optional[int], action: Optional[str]) -> Iterator[bytes]:
+    """Yield audit logs as NDJSON lines"""
+    # The stream outlives the request-scoped session, so it uses its own
+    db = SessionLocal()
+    try:
+        for log in crud.stream_audit_logs(db, user_id=user_id, action=action):
+            entry = AuditLogResponse(
+                id=log.id,
+                user_id=log.user_id,
+                username=log.user.username if log.user else None,
+                action=log.action,
+                resource=log.resource,
+                details=log.details,
+                ip_address=log.ip_address,
+                created_at=log.created_at,
+                success=log.success
+            )
+            yield entry.model_dump_json().encode() + b"\n"
+    finally:
+        db.close()
+
+
+@router.get("/export")
+async def export_audit_logs(
+    user_id: Optional[int] = None,
+    action: Optional[str] = None,
+    _: User = Depends(require_admin)
+):
+    """
+    Export audit logs as newline-delimited JSON (admin only)
+    
+    Logs are streamed newest first without loading the whole table.
+    
+    - **user_id**: Only logs of this user
+    - **action**: Only logs with this action (login, logout, ...)
+    """
+    return StreamingResponse(
+        _export_lines(user_id, action),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": "attachment; filename=audit_logs.ndjson"}
+    )
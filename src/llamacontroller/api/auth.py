@@ -2,6 +2,7 @@
 Authentication API endpoints
 """
 from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from llamacontroller.api.dependencies import get_db
@@ -50,10 +51,11 @@ async def login(
     # Create authentication service
     auth_service = AuthService(db)
     
-    # Authenticate user
-    success, error_msg, user = auth_service.authenticate_user(
+    # Authenticate user (bcrypt check runs in the threadpool, off the event loop)
+    success, error_msg, user = await run_in_threadpool(
+        auth_service.authenticate_user,
         username=login_req.username,
-        password=login_req.password,
+        password=login_req.password.get_secret_value(),
         ip_address=ip_address
     )
     
@@ -140,11 +142,12 @@ async def change_password(
     # Create authentication service
     auth_service = AuthService(db)
     
-    # Change password
-    success, error_msg = auth_service.change_password(
+    # Change password (bcrypt check + rehash run in the threadpool)
+    success, error_msg = await run_in_threadpool(
+        auth_service.change_password,
         user=current_user,
-        old_password=password_req.old_password,
-        new_password=password_req.new_password,
+        old_password=password_req.old_password.get_secret_value(),
+        new_password=password_req.new_password.get_secret_value(),
         ip_address=ip_address
     )
     
@@ -2,14 +2,14 @@
 FastAPI dependencies for dependency injection.
 """
 
-from typing import Optional, Generator
+from typing import Optional
 from fastapi import Depends, HTTPException, status
 from functools import lru_cache
-from sqlalchemy.orm import Session
 
 from ..core.config import ConfigManager
 from ..core.lifecycle import ModelLifecycleManager
-from ..db.base import SessionLocal
+# Single request-scoped session dependency, shared with the auth and web routers
+from llamacontroller.db.base import get_db  # noqa: F401
 
 # Global instances (will be initialized on app startup)
 _config_manager: Optional[ConfigManager] = None
@@ -85,16 +85,3 @@ async def verify_model_loaded(
             detail="No model is currently loaded"
         )
     return lifecycle
-
-def get_db() -> Generator[Session, None, None]:
-    """
-    Get database session.
-    
-    Yields:
-        Database session
-    """
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
@@ -16,7 +16,7 @@ from ..models.gpu import (
     GpuDetectionConfigResponse,
     GpuProcessInfoResponse
 )
-from ..db.models import User
+from llamacontroller.db.models import User
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
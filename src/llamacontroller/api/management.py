@@ -4,36 +4,61 @@ These are LlamaController-specific endpoints for model management.
 """
 
 import logging
-from typing import List, Union
+from typing import Dict, List, Optional, Union
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from ..core.lifecycle import ModelLifecycleManager, LifecycleError
 from ..models.api import (
-    LoadModelRequest,
-    SwitchModelRequest,
     ModelInfoResponse,
     ModelStatusResponse,
-    HealthCheckResponse,
     ListModelsResponse,
     ServerLogsResponse,
 )
 from ..models.lifecycle import (
+    LoadModelRequest,
     LoadModelResponse, 
     UnloadModelResponse, 
     UnloadModelRequest,
+    SwitchModelRequest,
     SwitchModelResponse,
+    HealthCheckResponse,
     AllGpuStatus,
     GpuInstanceStatus,
 )
 from .dependencies import get_lifecycle_manager
+from .responses import OrjsonResponse
 from ..auth.dependencies import get_current_user
-from ..db.models import User
+from llamacontroller.db.models import User
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1", tags=["management"])
 
-@router.get("/health", response_model=HealthCheckResponse)
+def _gpu_statuses_to_columns(statuses: Dict[str, Optional[GpuInstanceStatus]]) -> dict:
+    """
+    Flatten per-GPU statuses into the column layout of AllGpuStatus.
+    
+    Args:
+        statuses: Mapping of GPU ID to GpuInstanceStatus (None if not loaded)
+    
+    Returns:
+        Plain dict ready for a single orjson encode
+    """
+    instances = [s for s in statuses.values() if s is not None]
+    return {
+        "gpu_ids": [s.gpu_id for s in instances],
+        "ports": [s.port for s in instances],
+        "model_ids": [s.model_id for s in instances],
+        "model_names": [s.model_name for s in instances],
+        "statuses": [s.status for s in instances],
+        "loaded_at": [s.loaded_at for s in instances],
+        "uptime_seconds": [s.uptime_seconds for s in instances],
+        "pids": [s.pid for s in instances],
+        "memory_used_mb": [s.memory_used_mb for s in instances],
+        "memory_total_mb": [s.memory_total_mb for s in instances],
+    }
+
+@router.get("/health", response_class=OrjsonResponse, responses={200: {"model": HealthCheckResponse}})
 async def health_check(
     lifecycle: ModelLifecycleManager = Depends(get_lifecycle_manager),
     current_user: User = Depends(get_current_user)
@@ -46,7 +71,7 @@ async def health_check(
     """
     try:
         health = await lifecycle.healthcheck()
-        return health
+        return OrjsonResponse(health.model_dump())
     except Exception as e:
         logger.error(f"Health check failed: {e}")
         raise HTTPException(
@@ -54,7 +79,7 @@ async def health_check(
             detail=f"Health check failed: {str(e)}"
         )
 
-@router.get("/models", response_model=ListModelsResponse)
+@router.get("/models", response_class=OrjsonResponse, responses={200: {"model": ListModelsResponse}})
 async def list_models(
     lifecycle: ModelLifecycleManager = Depends(get_lifecycle_manager),
     current_user: User = Depends(get_current_user)
@@ -83,7 +108,7 @@ async def list_models(
             for model in models
         ]
         
-        return ListModelsResponse(models=model_responses)
+        return OrjsonResponse(ListModelsResponse(models=model_responses).model_dump())
     except Exception as e:
         logger.error(f"Failed to list models: {e}")
         raise HTTPException(
@@ -91,7 +116,7 @@ async def list_models(
             detail=f"Failed to list models: {str(e)}"
         )
 
-@router.get("/models/status", response_model=ModelStatusResponse)
+@router.get("/models/status", response_class=OrjsonResponse, responses={200: {"model": ModelStatusResponse}})
 async def get_model_status(
     lifecycle: ModelLifecycleManager = Depends(get_lifecycle_manager),
     current_user: User = Depends(get_current_user)
@@ -110,7 +135,7 @@ async def get_model_status(
         if status_info.status == "running" and status_info.host and status_info.port:
             server_url = f"http://{status_info.host}:{status_info.port}"
         
-        return ModelStatusResponse(
+        return OrjsonResponse(ModelStatusResponse(
             model_id=status_info.model_id,
             model_name=status_info.model_name,
             status=status_info.status,
@@ -121,7 +146,7 @@ async def get_model_status(
             host=status_info.host,
             port=status_info.port,
             server_url=server_url,
-        )
+        ).model_dump())
     except Exception as e:
         logger.error(f"Failed to get model status: {e}")
         raise HTTPException(
@@ -129,7 +154,7 @@ async def get_model_status(
             detail=f"Failed to get model status: {str(e)}"
         )
 
-@router.get("/gpu/status", response_model=AllGpuStatus)
+@router.get("/gpu/status", response_class=OrjsonResponse, responses={200: {"model": AllGpuStatus}})
 async def get_all_gpu_statuses(
     lifecycle: ModelLifecycleManager = Depends(get_lifecycle_manager),
     current_user: User = Depends(get_current_user)
@@ -141,7 +166,8 @@ async def get_all_gpu_statuses(
         AllGpuStatus with all GPU statuses
     """
     try:
-        return await lifecycle.get_all_gpu_statuses()
+        statuses = await lifecycle.get_all_gpu_statuses()
+        return OrjsonResponse(_gpu_statuses_to_columns(statuses))
     except Exception as e:
         logger.error(f"Failed to get GPU statuses: {e}")
         raise HTTPException(
@@ -149,7 +175,7 @@ async def get_all_gpu_statuses(
             detail=f"Failed to get GPU statuses: {str(e)}"
         )
 
-@router.get("/gpu/{gpu_id}/status", response_model=GpuInstanceStatus)
+@router.get("/gpu/{gpu_id}/status", response_class=OrjsonResponse, responses={200: {"model": GpuInstanceStatus}})
 async def get_gpu_status(
     gpu_id: Union[int, str],
     lifecycle: ModelLifecycleManager = Depends(get_lifecycle_manager),
@@ -171,15 +197,15 @@ async def get_gpu_status(
         else:
             gpu_param = int(gpu_id)
         
-        status = await lifecycle.get_gpu_status(gpu_param)
+        gpu_status = await lifecycle.get_gpu_status(gpu_param)
         
-        if status is None:
+        if gpu_status is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"No model loaded on GPU {gpu_id}"
             )
         
-        return status
+        return OrjsonResponse(gpu_status.model_dump())
     except ValueError:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -290,7 +316,7 @@ async def switch_model(
             detail=f"Failed to switch model: {str(e)}"
         )
 
-@router.get("/logs", response_model=ServerLogsResponse)
+@router.get("/logs", response_class=OrjsonResponse, responses={200: {"model": ServerLogsResponse}})
 async def get_server_logs(
     gpu_id: Union[int, str] = 0,
     lines: int = 100,
@@ -310,10 +336,7 @@ async def get_server_logs(
     try:
         log_lines = await lifecycle.get_server_logs(gpu_id=gpu_id, lines=lines)
         
-        return ServerLogsResponse(
-            logs=log_lines,
-            total_lines=len(log_lines)
-        )
+        return OrjsonResponse({"logs": log_lines, "total_lines": len(log_lines)})
     except Exception as e:
         logger.error(f"Failed to get server logs: {e}")
         raise HTTPException(
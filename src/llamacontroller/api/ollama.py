@@ -6,10 +6,10 @@ These endpoints mimic Ollama's API for compatibility with existing clients.
 import logging
 import httpx
 import os
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import AsyncIterator
 from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import StreamingResponse, JSONResponse
+from fastapi.responses import StreamingResponse, JSONResponse, Response
 
 from ..core.lifecycle import ModelLifecycleManager
 from ..core.config import ConfigManager
@@ -20,18 +20,21 @@ from ..models.ollama import (
     ChatResponse,
     ChatMessage,
     TagsResponse,
-    ModelInfo as OllamaModelInfo,
+    OllamaModelInfo,
     ModelDetails,
     ShowRequest,
     ShowResponse,
     ProcessResponse,
     RunningModel,
+    MODEL_LIST_ADAPTER,
+    RUNNING_MODEL_LIST_ADAPTER,
     DeleteRequest,
     ErrorResponse,
 )
 from .dependencies import get_lifecycle_manager, get_config_manager, verify_model_loaded
+from .responses import OrjsonResponse
 from ..auth.dependencies import get_current_user
-from ..db.models import User
+from llamacontroller.db.models import User
 
 logger = logging.getLogger(__name__)
 
@@ -83,26 +86,37 @@ async def _stream_llama_cpp_response(
     endpoint: str,
     json_data: dict,
     config: ConfigManager
-) -> AsyncIterator[str]:
+) -> AsyncIterator[bytes]:
     """
     Stream responses from llama.cpp server.
     
+    Lines are split and forwarded as raw bytes, so per-token chunks are
+    never decoded to str or re-encoded on the way through.
+    
     Args:
         endpoint: API endpoint path
         json_data: JSON data to send
         config: ConfigManager instance
         
     Yields:
-        JSON strings for streaming response
+        Newline-terminated JSON lines for streaming response
     """
     base_url = _get_llama_cpp_url(config)
     url = f"{base_url}{endpoint}"
     
     async with httpx.AsyncClient(timeout=None) as client:
         async with client.stream("POST", url, json=json_data) as response:
-            async for line in response.aiter_lines():
-                if line:
-                    yield f"{line}\n"
+            buffer = b""
+            async for chunk in response.aiter_bytes():
+                buffer += chunk
+                *lines, buffer = buffer.split(b"\n")
+                for line in lines:
+                    line = line.rstrip(b"\r")
+                    if line:
+                        yield line + b"\n"
+            buffer = buffer.rstrip(b"\r")
+            if buffer:
+                yield buffer + b"\n"
 
 @router.post("/generate")
 async def generate(
@@ -133,16 +147,17 @@ async def generate(
         if request.system:
             llama_request["system_prompt"] = request.system
         
-        if request.options:
+        options = request.options
+        if options:
             # Map Ollama options to llama.cpp parameters
-            if "temperature" in request.options:
-                llama_request["temperature"] = request.options["temperature"]
-            if "top_p" in request.options:
-                llama_request["top_p"] = request.options["top_p"]
-            if "top_k" in request.options:
-                llama_request["top_k"] = request.options["top_k"]
-            if "num_predict" in request.options:
-                llama_request["n_predict"] = request.options["num_predict"]
+            if options.temperature is not None:
+                llama_request["temperature"] = options.temperature
+            if options.top_p is not None:
+                llama_request["top_p"] = options.top_p
+            if options.top_k is not None:
+                llama_request["top_k"] = options.top_k
+            if options.num_predict is not None:
+                llama_request["n_predict"] = options.num_predict
         
         # Stream or non-stream response
         if llama_request["stream"]:
@@ -172,7 +187,7 @@ async def generate(
             
             ollama_response = GenerateResponse(
                 model=request.model,
-                created_at=datetime.utcnow().isoformat() + "Z",
+                created_at=datetime.now(timezone.utc),
                 response=llama_response.get("content", ""),
                 done=True,
                 context=request.context,
@@ -184,7 +199,7 @@ async def generate(
                 eval_duration=llama_response.get("timings", {}).get("predicted_ms"),
             )
             
-            return ollama_response
+            return OrjsonResponse(ollama_response.model_dump())
             
     except HTTPException:
         raise
@@ -228,11 +243,12 @@ async def chat(
             "stream": request.stream if request.stream is not None else True,
         }
         
-        if request.options:
-            if "temperature" in request.options:
-                llama_request["temperature"] = request.options["temperature"]
-            if "top_p" in request.options:
-                llama_request["top_p"] = request.options["top_p"]
+        options = request.options
+        if options:
+            if options.temperature is not None:
+                llama_request["temperature"] = options.temperature
+            if options.top_p is not None:
+                llama_request["top_p"] = options.top_p
         
         # Use chat endpoint if available, otherwise use completion
         endpoint = "/v1/chat/completions"  # OpenAI-compatible endpoint
@@ -266,12 +282,12 @@ async def chat(
             
             ollama_response = ChatResponse(
                 model=request.model,
-                created_at=datetime.utcnow().isoformat() + "Z",
+                created_at=datetime.now(timezone.utc),
                 message=ChatMessage(role="assistant", content=assistant_content, images=None),
                 done=True,
             )
             
-            return ollama_response
+            return OrjsonResponse(ollama_response.model_dump())
             
     except HTTPException:
         raise
@@ -282,7 +298,7 @@ async def chat(
             detail=f"Chat failed: {str(e)}"
         )
 
-@router.get("/tags")
+@router.get("/tags", response_class=OrjsonResponse, responses={200: {"model": TagsResponse}})
 async def list_models(
     lifecycle: ModelLifecycleManager = Depends(get_lifecycle_manager),
     current_user: User = Depends(get_current_user)
@@ -296,6 +312,8 @@ async def list_models(
     try:
         models = lifecycle.get_available_models()
         
+        # Built from our own model config, so validation is skipped
+        # (model_construct); request-side models are still validated
         ollama_models = []
         for model in models:
             # Get file size if file exists
@@ -304,13 +322,13 @@ async def list_models(
                 size = os.path.getsize(model.path)
             
             ollama_models.append(
-                OllamaModelInfo(
+                OllamaModelInfo.model_construct(
                     name=model.id,
                     model=model.id,
-                    modified_at=datetime.utcnow().isoformat() + "Z",
+                    modified_at=datetime.now(timezone.utc),
                     size=size,
                     digest=f"sha256:{model.id}",  # Simplified digest
-                    details=ModelDetails(
+                    details=ModelDetails.model_construct(
                         format="gguf",
                         family=model.description or "unknown",
                         parameter_size=model.parameter_count or "unknown",
@@ -319,7 +337,10 @@ async def list_models(
                 )
             )
         
-        return TagsResponse(models=ollama_models)
+        return Response(
+            content=b'{"models":' + MODEL_LIST_ADAPTER.dump_json(ollama_models) + b'}',
+            media_type="application/json"
+        )
         
     except Exception as e:
         logger.error(f"Failed to list models: {e}")
@@ -400,7 +421,7 @@ async def get_version():
         "git_commit": "llamacontroller"
     }
 
-@router.get("/ps")
+@router.get("/ps", response_class=OrjsonResponse, responses={200: {"model": ProcessResponse}})
 async def list_running_models(
     lifecycle: ModelLifecycleManager = Depends(get_lifecycle_manager),
     current_user: User = Depends(get_current_user)
@@ -415,29 +436,33 @@ async def list_running_models(
         current_model = lifecycle.get_current_model()
         
         if current_model is None:
-            return ProcessResponse(models=[])
+            return Response(content=b'{"models":[]}', media_type="application/json")
         
         # Get file size
         size = 0
         if os.path.exists(current_model.path):
             size = os.path.getsize(current_model.path)
         
-        running_model = RunningModel(
+        # Built from our own model config, so validation is skipped
+        running_model = RunningModel.model_construct(
             name=current_model.id,
             model=current_model.id,
             size=size,
             digest=f"sha256:{current_model.id}",
-            details=ModelDetails(
+            details=ModelDetails.model_construct(
                 format="gguf",
                 family=current_model.metadata.family or "unknown",
                 parameter_size=current_model.metadata.parameter_count or "unknown",
                 quantization_level=current_model.metadata.quantization or "unknown"
             ),
-            expires_at=datetime.utcnow().isoformat() + "Z",
+            expires_at=datetime.now(timezone.utc),
             size_vram=0  # VRAM size not tracked yet
         )
         
-        return ProcessResponse(models=[running_model])
+        return Response(
+            content=b'{"models":' + RUNNING_MODEL_LIST_ADAPTER.dump_json([running_model]) + b'}',
+            media_type="application/json"
+        )
         
     except Exception as e:
         logger.error(f"Failed to list running models: {e}")
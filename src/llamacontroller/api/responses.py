@@ -0,0 +1,45 @@
+"""
+Response classes for API endpoints.
+"""
+
+from datetime import date, time
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+_ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj: Any) -> Any:
+    """Serialize types orjson does not handle natively."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (date, time)):
+        return obj.isoformat()
+    if isinstance(obj, UUID):
+        return str(obj)
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class OrjsonResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    Handlers on hot paths return this directly with plain dict content
+    (e.g. ``model.model_dump()``), which skips FastAPI's response_model
+    validation and jsonable_encoder pass.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=_ORJSON_OPTIONS)
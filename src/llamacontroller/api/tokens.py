@@ -78,10 +78,7 @@ async def create_token(
     )
     
     # 返回响应（包含原始令牌）
-    response = TokenResponse.from_orm(token)
-    response.token = raw_token
-    
-    return response
+    return TokenResponse.from_orm(token).model_copy(update={"token": raw_token})
 
 @router.patch("/{token_id}", response_model=TokenResponse)
 async def update_token(
@@ -2,10 +2,11 @@
 用户管理 API 端点（仅管理员）
 """
 from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from llamacontroller.api.dependencies import get_db
-from llamacontroller.auth.dependencies import require_admin
+from llamacontroller.auth.dependencies import require_admin, invalidate_cached_user
 from llamacontroller.auth.service import AuthService
 from llamacontroller.db import crud
 from llamacontroller.db.models import User
@@ -67,8 +68,9 @@ async def create_user(
     # 创建认证服务
     auth_service = AuthService(db)
     
-    # 创建用户
-    user = auth_service.create_user(
+    # 创建用户（bcrypt 哈希在线程池中执行，不阻塞事件循环）
+    user = await run_in_threadpool(
+        auth_service.create_user,
         username=user_req.username,
         password=user_req.password,
         role=user_req.role,
@@ -149,6 +151,7 @@ async def update_user(
     
     # 保存更新
     crud.update_user(db, user)
+    invalidate_cached_user(request, user.id)
     
     # 记录审计日志
     changes = []
@@ -203,6 +206,7 @@ async def delete_user(
     
     # 删除用户
     crud.delete_user(db, user)
+    invalidate_cached_user(request, user_id)
     
     # 记录审计日志
     crud.create_audit_log(
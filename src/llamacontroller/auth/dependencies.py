@@ -7,7 +7,7 @@ from sqlalchemy.orm import Session
 from typing import Optional
 
 from llamacontroller.api.dependencies import get_db
-from llamacontroller.db.models import User, Session as DBSession
+from llamacontroller.db.models import User, APIToken, Session as DBSession
 from llamacontroller.auth.service import AuthService
 from llamacontroller.auth.utils import get_client_ip, get_user_agent
 from llamacontroller.db import crud
@@ -15,11 +15,57 @@ from llamacontroller.db import crud
 # HTTP Bearer token scheme
 bearer_scheme = HTTPBearer(auto_error=False)
 
-def get_auth_service(db: Session = Depends(get_db)) -> AuthService:
+def _get_request_cache(request: Request, name: str) -> dict:
+    """
+    Get a dict cache stored on request.state
+    
+    The cache lives only for the current request, so nested dependencies
+    can share lookups without any cross-request invalidation.
+    """
+    cache = getattr(request.state, name, None)
+    if cache is None:
+        cache = {}
+        setattr(request.state, name, cache)
+    return cache
+
+def get_cached_user(request: Request, db: Session, user_id: int) -> Optional[User]:
+    """
+    Get user by ID, cached for the lifetime of the request
+    
+    Returns:
+        User if found, otherwise None
+    """
+    cache = _get_request_cache(request, "user_cache")
+    if user_id not in cache:
+        cache[user_id] = crud.get_user_by_id(db, user_id)
+    return cache[user_id]
+
+def get_cached_api_token(request: Request, db: Session, raw_token: str) -> Optional[APIToken]:
+    """
+    Verify API token, cached for the lifetime of the request
+    
+    Returns:
+        APIToken if valid, otherwise None
+    """
+    cache = _get_request_cache(request, "token_cache")
+    if raw_token not in cache:
+        cache[raw_token] = crud.verify_api_token(db, raw_token)
+    return cache[raw_token]
+
+def invalidate_cached_user(request: Request, user_id: int) -> None:
+    """Drop a user from the request cache after it has been modified or deleted"""
+    _get_request_cache(request, "user_cache").pop(user_id, None)
+
+def get_auth_service(request: Request, db: Session = Depends(get_db)) -> AuthService:
     """Get authentication service instance"""
-    return AuthService(db)
+    return AuthService(
+        db,
+        user_cache=_get_request_cache(request, "user_cache"),
+        token_cache=_get_request_cache(request, "token_cache")
+    )
 
 async def verify_api_token(
+    request: Request,
     authorization: str = Header(None),
     db: Session = Depends(get_db)
 ) -> User:
@@ -30,6 +76,7 @@ async def verify_api_token(
     Expected format: Authorization: Bearer llc_xxxxx
     
     Args:
+        request: Current request
         authorization: Authorization header value
         db: Database session
         
@@ -56,7 +103,7 @@ async def verify_api_token(
     token = authorization[7:]  # Remove "Bearer " prefix
     
     # Verify token
-    api_token = crud.verify_api_token(db, token)
+    api_token = get_cached_api_token(request, db, token)
     if not api_token:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -65,7 +112,7 @@ async def verify_api_token(
         )
     
     # Get user
-    user = crud.get_user_by_id(db, api_token.user_id)
+    user = get_cached_user(request, db, api_token.user_id)
     if not user or not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -73,12 +120,10 @@ async def verify_api_token(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    # Update last_used_at timestamp
-    crud.update_api_token_last_used(db, api_token)
-    
     return user
 
 def get_current_user_from_session(
+    request: Request,
     session_id: str = Cookie(None, alias="session_id"),
     x_session_id: str = Header(None, alias="X-Session-ID"),
     db: Session = Depends(get_db)
@@ -108,7 +153,7 @@ def get_current_user_from_session(
         )
     
     # Get user
-    user = crud.get_user_by_id(db, session.user_id)
+    user = get_cached_user(request, db, session.user_id)
     
     if user is None or not user.is_active:
         raise HTTPException(
@@ -167,7 +212,7 @@ async def get_optional_user_from_session(
         return None
     
     # Get user
-    user = crud.get_user_by_id(db, session.user_id)
+    user = get_cached_user(request, db, session.user_id)
     
     return user if user and user.is_active else None
 
@@ -14,16 +14,32 @@ from llamacontroller.models.auth import LoginResponse, UserResponse, SessionInfo
 class AuthService:
     """Authentication service class"""
     
-    def __init__(self, db: Session, session_timeout: int = 3600):
+    def __init__(
+        self,
+        db: Session,
+        session_timeout: int = 3600,
+        user_cache: Optional[dict] = None,
+        token_cache: Optional[dict] = None
+    ):
         """
         Initialize authentication service
         
         Args:
             db: Database session
             session_timeout: Session timeout in seconds, default 1 hour
+            user_cache: Request-scoped user cache keyed by user ID (optional)
+            token_cache: Request-scoped verified token cache keyed by raw token (optional)
         """
         self.db = db
         self.session_timeout = session_timeout
+        self.user_cache = user_cache if user_cache is not None else {}
+        self.token_cache = token_cache if token_cache is not None else {}
+    
+    def _get_user(self, user_id: int) -> Optional[User]:
+        """Get user by ID through the user cache"""
+        if user_id not in self.user_cache:
+            self.user_cache[user_id] = crud.get_user_by_id(self.db, user_id)
+        return self.user_cache[user_id]
     
     def authenticate_user(
         self,
@@ -136,7 +152,7 @@ class AuthService:
             return None
         
         # Get user
-        user = crud.get_user_by_id(self.db, session.user_id)
+        user = self._get_user(session.user_id)
         
         # Check if user is active
         if user is None or not user.is_active:
@@ -160,7 +176,10 @@ class AuthService:
         if session is None:
             return False
         
-        # Record logout
+        # Delete session
+        crud.delete_session(self.db, session)
+        
+        # Record logout (commits the delete as well)
         crud.create_audit_log(
             self.db,
             action="logout",
@@ -169,9 +188,6 @@ class AuthService:
             ip_address=ip_address
         )
         
-        # Delete session
-        crud.delete_session(self.db, session)
-        
         return True
     
     def verify_api_token(self, raw_token: str) -> Optional[User]:
@@ -184,13 +200,15 @@ class AuthService:
         Returns:
             User if token is valid, otherwise None
         """
-        token = crud.verify_api_token(self.db, raw_token)
+        if raw_token not in self.token_cache:
+            self.token_cache[raw_token] = crud.verify_api_token(self.db, raw_token)
+        token = self.token_cache[raw_token]
         
         if token is None:
             return None
         
         # Get user
-        user = crud.get_user_by_id(self.db, token.user_id)
+        user = self._get_user(token.user_id)
         
         # Check if user is active
         if user is None or not user.is_active:
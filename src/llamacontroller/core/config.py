@@ -2,9 +2,13 @@
 Configuration manager for loading and validating YAML configurations.
 """
 
+import copy
+import functools
+import mmap
+from concurrent.futures import ThreadPoolExecutor
 import yaml
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 import logging
 
 from ..models.config import (
@@ -12,10 +16,75 @@ from ..models.config import (
     LlamaCppConfig,
     ModelsConfig,
     AuthConfig,
+    LLAMA_CPP_CONFIG_ADAPTER,
+    MODELS_CONFIG_ADAPTER,
+    AUTH_CONFIG_ADAPTER,
 )
 
 logger = logging.getLogger(__name__)
 
+# Known default/weak passwords flagged by validate_config
+_WEAK_PASSWORDS = frozenset({"admin", "admin123", "password", "12345", "changeme"})
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Optional Rust-backed parser; used in preference to PyYAML when installed
+try:
+    import ryaml
+except ImportError:
+    ryaml = None
+
+
+class _FastScalarLoader(_YamlLoader):
+    """
+    Safe loader that tries plain int()/float() on scalars first.
+    
+    Falls back to PyYAML's constructors for the forms Python does
+    not parse the same way (hex/octal/sexagesimal, '.inf', etc.).
+    """
+
+    def construct_yaml_int(self, node):
+        digits = node.value.lstrip('+-')
+        # A leading zero means octal in YAML 1.1, which int() would misread
+        if not (digits.startswith('0') and len(digits) > 1):
+            try:
+                return int(node.value)
+            except ValueError:
+                pass
+        return super().construct_yaml_int(node)
+
+    def construct_yaml_float(self, node):
+        try:
+            return float(node.value)
+        except ValueError:
+            return super().construct_yaml_float(node)
+
+
+_FastScalarLoader.add_constructor("tag:yaml.org,2002:int", _FastScalarLoader.construct_yaml_int)
+_FastScalarLoader.add_constructor("tag:yaml.org,2002:float", _FastScalarLoader.construct_yaml_float)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_yaml_file(path: str, mtime_ns: int, size: int) -> Any:
+    """
+    Parse a YAML file, cached per (path, mtime, size).
+    
+    The stat fields are part of the cache key so an edited file is
+    re-parsed; callers must copy the result before handing it out.
+    """
+    if ryaml is not None:
+        return ryaml.loads(Path(path).read_text(encoding='utf-8'))
+    if size == 0:
+        # mmap rejects empty files; an empty document parses to None anyway
+        return None
+    # Map the file read-only so the parser reads straight from the page cache
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return yaml.load(mm, Loader=_FastScalarLoader)
+
 
 class ConfigError(Exception):
     """Exception raised for configuration errors."""
@@ -64,11 +133,12 @@ class ConfigManager:
             raise ConfigError(f"Configuration file not found: {filepath}")
         
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-                if data is None:
-                    raise ConfigError(f"Configuration file is empty: {filepath}")
-                return data
+            stat = filepath.stat()
+            data = _parse_yaml_file(str(filepath.resolve()), stat.st_mtime_ns, stat.st_size)
+            if data is None:
+                raise ConfigError(f"Configuration file is empty: {filepath}")
+            # Callers may mutate the result, so never hand out the cached object
+            return copy.deepcopy(data)
         except yaml.YAMLError as e:
             raise ConfigError(f"Failed to parse YAML file {filepath}: {e}")
         except Exception as e:
@@ -86,7 +156,7 @@ class ConfigManager:
         """
         try:
             data = self.load_yaml_file("llamacpp-config.yaml")
-            return LlamaCppConfig(**data.get("llama_cpp", {}))
+            return LLAMA_CPP_CONFIG_ADAPTER.validate_python(data.get("llama_cpp", {}))
         except ValueError as e:
             raise ConfigError(f"Invalid llama.cpp configuration: {e}")
     
@@ -102,7 +172,7 @@ class ConfigManager:
         """
         try:
             data = self.load_yaml_file("models-config.yaml")
-            return ModelsConfig(**data)
+            return MODELS_CONFIG_ADAPTER.validate_python(data)
         except ValueError as e:
             raise ConfigError(f"Invalid models configuration: {e}")
     
@@ -118,7 +188,7 @@ class ConfigManager:
         """
         try:
             data = self.load_yaml_file("auth-config.yaml")
-            return AuthConfig(**data.get("authentication", {}))
+            return AUTH_CONFIG_ADAPTER.validate_python(data.get("authentication", {}))
         except ValueError as e:
             raise ConfigError(f"Invalid authentication configuration: {e}")
     
@@ -135,13 +205,19 @@ class ConfigManager:
         logger.info("Loading configuration files...")
         
         try:
-            llama_cpp_config = self.load_llama_cpp_config()
+            # The files are independent, so read and parse them concurrently
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                llama_cpp_future = executor.submit(self.load_llama_cpp_config)
+                models_future = executor.submit(self.load_models_config)
+                auth_future = executor.submit(self.load_auth_config)
+            
+            llama_cpp_config = llama_cpp_future.result()
             logger.info("✓ llama.cpp configuration loaded")
             
-            models_config = self.load_models_config()
+            models_config = models_future.result()
             logger.info(f"✓ Models configuration loaded ({len(models_config.models)} models)")
             
-            auth_config = self.load_auth_config()
+            auth_config = auth_future.result()
             logger.info(f"✓ Authentication configuration loaded ({len(auth_config.users)} users)")
             
             self._config = AppConfig(
@@ -209,7 +285,7 @@ class ConfigManager:
         
         # Check for default passwords
         for user in self._config.auth.users:
-            if user.password in ["admin123", "password", "12345"]:
+            if user.password in _WEAK_PASSWORDS:
                 warnings.append(
                     f"User '{user.username}' has a weak default password. "
                     "Change it in production!"
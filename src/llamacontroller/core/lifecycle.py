@@ -19,7 +19,7 @@ from ..models.lifecycle import (
     LoadModelResponse,
     UnloadModelResponse,
     SwitchModelResponse,
-    ModelInfo,
+    LocalModelInfo,
     HealthCheckResponse,
     GpuInstanceStatus,
     AllGpuStatus,
@@ -55,6 +55,12 @@ class ModelLifecycleManager:
     
     Provides operations for loading, unloading, and switching models
     across multiple GPUs, managing separate llama.cpp process instances.
+    
+    Response models returned here are built with model_construct(): their
+    data comes from validated config and our own process state, never from
+    request input, so pydantic validation is skipped. Models with
+    use_enum_values get ProcessStatus values (.value) explicitly since
+    model_construct() does not apply that conversion.
     """
     
     def __init__(self, config_manager: ConfigManager):
@@ -289,8 +295,7 @@ class ModelLifecycleManager:
             port = self.get_port_for_gpu(normalized_gpu_id)
             
             # Create llama.cpp config copy with specific port
-            llama_config = self.config_manager.llama_cpp.model_copy(deep=True)
-            llama_config.default_port = port
+            llama_config = self.config_manager.llama_cpp.model_copy(update={"default_port": port})
             
             # Create new adapter instance
             adapter = LlamaCppAdapter(llama_config)
@@ -360,7 +365,7 @@ class ModelLifecycleManager:
             
             logger.info(f"Model '{model_id}' loaded successfully on GPU {normalized_gpu_id}")
             
-            return LoadModelResponse(
+            return LoadModelResponse.model_construct(
                 success=True,
                 model_id=model_id,
                 message=f"Model '{model_config.name}' loaded on GPU {normalized_gpu_id}",
@@ -390,7 +395,7 @@ class ModelLifecycleManager:
         
         # Check if GPU has a model loaded
         if normalized_gpu_id not in self.gpu_instances:
-            return UnloadModelResponse(
+            return UnloadModelResponse.model_construct(
                 success=True,
                 message=f"No model loaded on GPU {normalized_gpu_id}"
             )
@@ -413,7 +418,7 @@ class ModelLifecycleManager:
             
             logger.info(f"Model '{model_id}' unloaded from GPU {normalized_gpu_id}")
             
-            return UnloadModelResponse(
+            return UnloadModelResponse.model_construct(
                 success=True,
                 message=f"Model '{model_id}' unloaded from GPU {normalized_gpu_id}"
             )
@@ -456,7 +461,7 @@ class ModelLifecycleManager:
                 # 如果是同一个模型，直接返回
                 if old_model_id == new_model_id:
                     status = await self._get_instance_status(self.gpu_instances[normalized_gpu_id])
-                    return SwitchModelResponse(
+                    return SwitchModelResponse.model_construct(
                         success=True,
                         old_model_id=old_model_id,
                         new_model_id=new_model_id,
@@ -478,7 +483,7 @@ class ModelLifecycleManager:
             
             logger.info(f"Successfully switched to model '{new_model_id}' on GPU {normalized_gpu_id}")
             
-            return SwitchModelResponse(
+            return SwitchModelResponse.model_construct(
                 success=True,
                 old_model_id=old_model_id,
                 new_model_id=new_model_id,
@@ -506,10 +511,10 @@ class ModelLifecycleManager:
                 return await self._get_instance_status(instance)
         
         # No models loaded
-        return ModelStatus(
+        return ModelStatus.model_construct(
             model_id=None,
             model_name=None,
-            status=ProcessStatus.STOPPED,
+            status=ProcessStatus.STOPPED.value,
             loaded_at=None,
             memory_usage_mb=None,
             uptime_seconds=None,
@@ -545,12 +550,12 @@ class ModelLifecycleManager:
         # Query current memory (fresh data on every status check)
         memory_info = self._query_gpu_memory(normalized_gpu_id)
         
-        status_obj = GpuInstanceStatus(
+        status_obj = GpuInstanceStatus.model_construct(
             gpu_id=normalized_gpu_id,
             port=instance.port,
             model_id=instance.model_id,
             model_name=instance.model_config.name,
-            status=instance.adapter.get_status(),
+            status=instance.adapter.get_status().value,
             loaded_at=instance.load_time,
             uptime_seconds=instance.adapter.get_uptime_seconds(),
             pid=instance.adapter.get_pid(),
@@ -590,10 +595,10 @@ class ModelLifecycleManager:
         Returns:
             ModelStatus
         """
-        return ModelStatus(
+        return ModelStatus.model_construct(
             model_id=instance.model_id,
             model_name=instance.model_config.name,
-            status=instance.adapter.get_status(),
+            status=instance.adapter.get_status().value,
             loaded_at=instance.load_time,
             memory_usage_mb=None,  # TODO: Implement memory tracking
             uptime_seconds=instance.adapter.get_uptime_seconds(),
@@ -631,7 +636,7 @@ class ModelLifecycleManager:
                 uptime = instance.adapter.get_uptime_seconds()
                 
                 if is_healthy:
-                    return HealthCheckResponse(
+                    return HealthCheckResponse.model_construct(
                         healthy=True,
                         status=status,
                         message=f"Model '{instance.model_id}' on GPU {instance.gpu_id} is healthy",
@@ -639,19 +644,19 @@ class ModelLifecycleManager:
                     )
         
         # No healthy instances
-        return HealthCheckResponse(
+        return HealthCheckResponse.model_construct(
             healthy=False,
             status=ProcessStatus.STOPPED,
             message="No healthy model instances running",
             uptime_seconds=None
         )
     
-    def get_available_models(self) -> List[ModelInfo]:
+    def get_available_models(self) -> List[LocalModelInfo]:
         """
         Get list of available models
         
         Returns:
-            List of ModelInfo
+            List of LocalModelInfo
         """
         models = []
         loaded_model_ids = {inst.model_id for inst in self.gpu_instances.values()}
@@ -660,7 +665,7 @@ class ModelLifecycleManager:
             is_loaded = model_config.id in loaded_model_ids
             status = "loaded" if is_loaded else "available"
             
-            models.append(ModelInfo(
+            models.append(LocalModelInfo.model_construct(
                 id=model_config.id,
                 name=model_config.name,
                 path=model_config.path,
@@ -4,6 +4,7 @@ Database basic configuration
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from typing import Generator
 import os
 
@@ -13,12 +14,41 @@ DATABASE_URL = os.getenv(
     "sqlite:///./data/llamacontroller.db"
 )
 
+# Connection pool settings (override via environment variables)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # seconds
+
+
+def _engine_options(url: str) -> dict:
+    """
+    Build create_engine() keyword arguments for the given database URL
+    
+    In-memory SQLite needs a single shared connection (StaticPool). Everything
+    else uses a QueuePool so connections are reused across requests instead of
+    being opened per request.
+    """
+    options = {
+        "echo": False,  # Set to True to see SQL statements
+        "pool_pre_ping": True,
+    }
+    
+    if url.startswith("sqlite"):
+        options["connect_args"] = {"check_same_thread": False}
+        if url in ("sqlite://", "sqlite:///:memory:") or "mode=memory" in url:
+            options["poolclass"] = StaticPool
+            return options
+    
+    options.update(
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_recycle=DB_POOL_RECYCLE,
+    )
+    return options
+
+
 # Create database engine
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {},
-    echo=False  # Set to True to see SQL statements
-)
+engine = create_engine(DATABASE_URL, **_engine_options(DATABASE_URL))
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -31,6 +61,14 @@ def get_db() -> Generator:
     """
     Dependency injection function for database session
     
+    The session is committed once when the request succeeds and rolled
+    back if it raises. FastAPI runs this exit code after the response has
+    been sent, so an endpoint that reports a write as successful must
+    commit it explicitly first (the create_* CRUDs and create_audit_log do);
+    the exit commit only picks up whatever is still pending. Code outside a
+    request (scripts, background tasks) should use SessionLocal and commit
+    itself.
+    
     For FastAPI dependency injection:
     ```python
     @app.get("/")
@@ -41,6 +79,11 @@ def get_db() -> Generator:
     db = SessionLocal()
     try:
         yield db
+        # Commit whatever the request left pending (e.g. flushed deletes)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
     finally:
         db.close()
 
@@ -54,6 +97,12 @@ def init_db() -> None:
     
     # Create all tables
     Base.metadata.create_all(bind=engine)
+    
+    # create_all() skips tables that already exist; add any indexes
+    # introduced since an existing database was created
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
 
 
 def reset_db() -> None:
@@ -1,38 +1,136 @@
 """
 Database CRUD operations
+
+Commit policy: create_*, update_* and the login counter helpers commit
+themselves. Their result is returned to the client (session cookie, new
+token, user id), and get_db only commits after the response is sent, so
+the row must exist before the response goes out. The failed-login counter
+must also persist when the request then fails, which get_db would roll
+back. delete_* and the legacy token hash upgrade in verify_api_token only
+flush and are committed with the caller's transaction.
 """
-from sqlalchemy.orm import Session
-from typing import Optional, List
+from sqlalchemy import select, insert, update, bindparam, case, or_, lambda_stmt
+from sqlalchemy.orm import Session, selectinload, joinedload
+from typing import Optional, List, Iterator
 from datetime import datetime, timedelta
-import secrets
+from collections import OrderedDict
+import base64
 import hashlib
+import hmac
+import os
+import threading
 
 from llamacontroller.db.models import User, APIToken, Session as DBSession, AuditLog
 
+# Pending last_used_at updates {token_id: last_used_at}, flushed periodically
+# by flush_api_token_last_used() instead of writing on every request
+LAST_USED_BUFFER_MAX_SIZE = 10000
+_last_used_buffer: "OrderedDict[int, datetime]" = OrderedDict()
+_last_used_lock = threading.Lock()
+
+_urandom = os.urandom
+_b64encode = base64.urlsafe_b64encode
+
+def _fast_token(nbytes: int = 32) -> str:
+    """Random URL-safe token, same output format as secrets.token_urlsafe()"""
+    return _b64encode(_urandom(nbytes)).rstrip(b'=').decode('ascii')
+
+# Hot-path lookups, built once as lambda statements so the SQL construct and
+# its cache key are not regenerated on every request
+_user_by_id_stmt = lambda_stmt(lambda: select(User).where(User.id == bindparam("user_id")))
+_user_by_username_stmt = lambda_stmt(lambda: select(User).where(User.username == bindparam("username")))
+_valid_token_by_hash_stmt = lambda_stmt(
+    lambda: select(APIToken).where(
+        APIToken.token_hash == bindparam("token_hash"),
+        APIToken.is_active == True,  # noqa: E712
+        or_(APIToken.expires_at.is_(None), APIToken.expires_at > bindparam("now"))
+    )
+)
+# Matches the current and the legacy hash in one indexed lookup, so a
+# verification costs the same query whether or not the token exists
+_valid_token_by_either_hash_stmt = lambda_stmt(
+    lambda: select(APIToken).where(
+        APIToken.token_hash.in_([bindparam("token_hash"), bindparam("legacy_hash")]),
+        APIToken.is_active == True,  # noqa: E712
+        or_(APIToken.expires_at.is_(None), APIToken.expires_at > bindparam("now"))
+    )
+)
+_session_by_id_stmt = lambda_stmt(lambda: select(DBSession).where(DBSession.session_id == bindparam("session_id")))
+
+def _hash_token(raw_token: str) -> str:
+    """Hash a raw token for storage (BLAKE2b, 32-byte digest, hex encoded)"""
+    return hashlib.blake2b(raw_token.encode(), digest_size=32).hexdigest()
+
+def _legacy_hash_token(raw_token: str) -> str:
+    """SHA-256 token hash used by older releases, still accepted on verification"""
+    return hashlib.sha256(raw_token.encode()).hexdigest()
+
+def _commit_returning(db: Session, obj) -> None:
+    """
+    Commit, expiring every loaded instance except obj
+    
+    obj was just filled by INSERT ... RETURNING, so expiring it would only
+    repeat on next access the SELECT that RETURNING saved.
+    """
+    expire_on_commit = db.expire_on_commit
+    db.expire_on_commit = False
+    try:
+        db.commit()
+    finally:
+        db.expire_on_commit = expire_on_commit
+    if expire_on_commit:
+        for instance in list(db.identity_map.values()):
+            if instance is not obj:
+                db.expire(instance)
+
 # ==================== User CRUD ====================
 
 def get_user_by_id(db: Session, user_id: int) -> Optional[User]:
     """Get user by ID"""
-    return db.query(User).filter(User.id == user_id).first()
+    return db.execute(_user_by_id_stmt, {"user_id": user_id}).scalar_one_or_none()
 
 def get_user_by_username(db: Session, username: str) -> Optional[User]:
     """Get user by username"""
-    return db.query(User).filter(User.username == username).first()
+    return db.execute(_user_by_username_stmt, {"username": username}).scalar_one_or_none()
 
-def get_users(db: Session, skip: int = 0, limit: int = 100) -> List[User]:
-    """Get list of users"""
-    return db.query(User).offset(skip).limit(limit).all()
+def get_users(
+    db: Session,
+    skip: int = 0,
+    limit: Optional[int] = 100,
+    *,
+    load_tokens: bool = False,
+    load_sessions: bool = False
+) -> List[User]:
+    """
+    Get list of users
+    
+    Args:
+        db: Database session
+        skip: Number of records to skip
+        limit: Maximum number of records (None for no limit)
+        load_tokens: Eager-load user.api_tokens in one extra query
+        load_sessions: Eager-load user.sessions in one extra query
+    """
+    query = db.query(User)
+    
+    if load_tokens:
+        query = query.options(selectinload(User.api_tokens))
+    
+    if load_sessions:
+        query = query.options(selectinload(User.sessions))
+    
+    return query.order_by(User.id).offset(skip).limit(limit).all()
 
 def create_user(db: Session, username: str, password_hash: str, role: str = "user") -> User:
     """Create new user"""
-    user = User(
-        username=username,
-        password_hash=password_hash,
-        role=role
-    )
-    db.add(user)
-    db.commit()
-    db.refresh(user)
+    user = db.execute(
+        insert(User).values(
+            username=username,
+            password_hash=password_hash,
+            role=role
+        ).returning(User)
+    ).scalar_one()
+    _commit_returning(db, user)
     return user
 
 def update_user(db: Session, user: User) -> User:
@@ -43,27 +141,37 @@ def update_user(db: Session, user: User) -> User:
     return user
 
 def delete_user(db: Session, user: User) -> None:
-    """Delete user"""
+    """Delete user (flushed only; committed with the caller's transaction)"""
     db.delete(user)
-    db.commit()
+    db.flush()
 
 def increment_failed_login(db: Session, user: User, lockout_duration: int = 300) -> User:
     """
     Increment failed login count
     
+    Runs as a single UPDATE evaluated by the database, so concurrent failed
+    logins cannot overwrite each other's increment and skip the lockout.
+    
     Args:
         db: Database session
         user: User object
         lockout_duration: Lockout duration in seconds, default 5 minutes
     """
-    user.failed_login_attempts += 1
+    attempts = User.failed_login_attempts + 1
     
     # Lock account if failed attempts reach 5
-    if user.failed_login_attempts >= 5:
-        user.locked_until = datetime.utcnow() + timedelta(seconds=lockout_duration)
-    
+    db.execute(
+        update(User)
+        .where(User.id == user.id)
+        .values(
+            failed_login_attempts=attempts,
+            locked_until=case(
+                (attempts >= 5, datetime.utcnow() + timedelta(seconds=lockout_duration)),
+                else_=User.locked_until
+            )
+        )
+    )
     db.commit()
-    db.refresh(user)
     return user
 
 def reset_failed_login(db: Session, user: User) -> User:
@@ -71,7 +179,6 @@ def reset_failed_login(db: Session, user: User) -> User:
     user.failed_login_attempts = 0
     user.locked_until = None
     db.commit()
-    db.refresh(user)
     return user
 
 # ==================== API Token CRUD ====================
@@ -84,9 +191,34 @@ def get_api_token_by_hash(db: Session, token_hash: str) -> Optional[APIToken]:
     """Get token by hash value"""
     return db.query(APIToken).filter(APIToken.token_hash == token_hash).first()
 
-def get_user_api_tokens(db: Session, user_id: int) -> List[APIToken]:
-    """Get all tokens for a user"""
-    return db.query(APIToken).filter(APIToken.user_id == user_id).all()
+def get_valid_api_token_by_hash(db: Session, token_hash: str) -> Optional[APIToken]:
+    """
+    Get an active, unexpired token by hash value
+    
+    The is_active filter lets the planner use the partial index
+    ix_api_tokens_active_token_hash; inactive or expired tokens return None
+    without a separate validity check.
+    """
+    return db.execute(
+        _valid_token_by_hash_stmt,
+        {"token_hash": token_hash, "now": datetime.utcnow()}
+    ).scalar_one_or_none()
+
+def get_user_api_tokens(db: Session, user_id: int, *, load_user: bool = False) -> List[APIToken]:
+    """
+    Get all tokens for a user
+    
+    Args:
+        db: Database session
+        user_id: User ID
+        load_user: Eager-load token.user in one extra query
+    """
+    query = db.query(APIToken).filter(APIToken.user_id == user_id)
+    
+    if load_user:
+        query = query.options(selectinload(APIToken.user))
+    
+    return query.all()
 
 def create_api_token(
     db: Session,
@@ -113,27 +245,26 @@ def create_api_token(
         raw_token = custom_token
     else:
         # Generate recommended length token (32 bytes = 43 chars base64)
-        raw_token = secrets.token_urlsafe(32)
+        raw_token = _fast_token(32)
     
     # Calculate hash for storage
-    token_hash = hashlib.sha256(raw_token.encode()).hexdigest()
+    token_hash = _hash_token(raw_token)
     
     # Calculate expiration time
     expires_at = None
     if expires_days is not None:
         expires_at = datetime.utcnow() + timedelta(days=expires_days)
     
-    # Create database record
-    api_token = APIToken(
-        user_id=user_id,
-        token_hash=token_hash,
-        name=name,
-        expires_at=expires_at
-    )
-    
-    db.add(api_token)
-    db.commit()
-    db.refresh(api_token)
+    # Create database record (RETURNING fills id and server defaults)
+    api_token = db.execute(
+        insert(APIToken).values(
+            user_id=user_id,
+            token_hash=token_hash,
+            name=name,
+            expires_at=expires_at
+        ).returning(APIToken)
+    ).scalar_one()
+    _commit_returning(db, api_token)
     
     return api_token, raw_token
 
@@ -147,15 +278,52 @@ def generate_token(length: int = 32) -> str:
     Returns:
         str: URL-safe base64 encoded token
     """
-    return secrets.token_urlsafe(length)
+    return _fast_token(length)
 
 def update_api_token_last_used(db: Session, token: APIToken) -> APIToken:
     """Update token last used time"""
     token.last_used_at = datetime.utcnow()
     db.commit()
-    db.refresh(token)
     return token
 
+def record_api_token_used(token_id: int) -> None:
+    """
+    Buffer token last used time
+    
+    The write is deferred to flush_api_token_last_used(). When the buffer is
+    full the least recently used entry is dropped.
+    """
+    with _last_used_lock:
+        _last_used_buffer[token_id] = datetime.utcnow()
+        _last_used_buffer.move_to_end(token_id)
+        if len(_last_used_buffer) > LAST_USED_BUFFER_MAX_SIZE:
+            _last_used_buffer.popitem(last=False)
+
+def flush_api_token_last_used(db: Session) -> int:
+    """
+    Write buffered token last used times in a single bulk UPDATE
+    
+    Returns:
+        int: Number of tokens updated
+    """
+    global _last_used_buffer
+    with _last_used_lock:
+        pending, _last_used_buffer = _last_used_buffer, OrderedDict()
+    
+    if not pending:
+        return 0
+    
+    # Core-level executemany: tokens deleted since they were used simply match no row
+    table = APIToken.__table__
+    db.execute(
+        update(table)
+        .where(table.c.id == bindparam("b_id"))
+        .values(last_used_at=bindparam("b_last_used_at")),
+        [{"b_id": token_id, "b_last_used_at": last_used_at} for token_id, last_used_at in pending.items()]
+    )
+    db.commit()
+    return len(pending)
+
 def update_api_token(db: Session, token: APIToken) -> APIToken:
     """Update token"""
     db.commit()
@@ -163,9 +331,9 @@ def update_api_token(db: Session, token: APIToken) -> APIToken:
     return token
 
 def delete_api_token(db: Session, token: APIToken) -> None:
-    """Delete token"""
+    """Delete token (flushed only; committed with the caller's transaction)"""
     db.delete(token)
-    db.commit()
+    db.flush()
 
 def verify_api_token(db: Session, raw_token: str) -> Optional[APIToken]:
     """
@@ -178,21 +346,31 @@ def verify_api_token(db: Session, raw_token: str) -> Optional[APIToken]:
     Returns:
         APIToken if valid, otherwise None
     """
-    # Calculate hash
-    token_hash = hashlib.sha256(raw_token.encode()).hexdigest()
+    # Tokens created before the switch to BLAKE2b are stored as SHA-256,
+    # so both hashes are always computed and looked up together
+    token_hash = _hash_token(raw_token)
+    legacy_hash = _legacy_hash_token(raw_token)
     
-    # Find token
-    token = get_api_token_by_hash(db, token_hash)
+    # Find token; validity (active, unexpired) is checked in the same query.
+    # The stored hash is re-compared in constant time as a second guard.
+    token = db.execute(
+        _valid_token_by_either_hash_stmt,
+        {"token_hash": token_hash, "legacy_hash": legacy_hash, "now": datetime.utcnow()}
+    ).scalars().first()
     
     if token is None:
         return None
     
-    # Check if valid
-    if not token.is_valid():
+    if hmac.compare_digest(token.token_hash, legacy_hash):
+        # Migrate to the new hash; flushed only, committed with the caller's
+        # transaction (a rolled-back request just migrates on the next one)
+        token.token_hash = token_hash
+        db.flush()
+    elif not hmac.compare_digest(token.token_hash, token_hash):
         return None
     
-    # Update last used time
-    update_api_token_last_used(db, token)
+    # Record last used time (written by the periodic flush)
+    record_api_token_used(token.id)
     
     return token
 
@@ -200,7 +378,7 @@ def verify_api_token(db: Session, raw_token: str) -> Optional[APIToken]:
 
 def get_session_by_id(db: Session, session_id: str) -> Optional[DBSession]:
     """Get session by session ID"""
-    return db.query(DBSession).filter(DBSession.session_id == session_id).first()
+    return db.execute(_session_by_id_stmt, {"session_id": session_id}).scalar_one_or_none()
 
 def get_user_sessions(db: Session, user_id: int) -> List[DBSession]:
     """Get all sessions for a user"""
@@ -214,27 +392,26 @@ def create_session(
     user_agent: Optional[str] = None
 ) -> DBSession:
     """Create session"""
-    session_id = secrets.token_urlsafe(32)
+    session_id = _fast_token(32)
     expires_at = datetime.utcnow() + timedelta(seconds=timeout_seconds)
     
-    session = DBSession(
-        session_id=session_id,
-        user_id=user_id,
-        expires_at=expires_at,
-        ip_address=ip_address,
-        user_agent=user_agent
-    )
-    
-    db.add(session)
-    db.commit()
-    db.refresh(session)
+    session = db.execute(
+        insert(DBSession).values(
+            session_id=session_id,
+            user_id=user_id,
+            expires_at=expires_at,
+            ip_address=ip_address,
+            user_agent=user_agent
+        ).returning(DBSession)
+    ).scalar_one()
+    _commit_returning(db, session)
     
     return session
 
 def delete_session(db: Session, session: DBSession) -> None:
-    """Delete session"""
+    """Delete session (flushed only; committed with the caller's transaction)"""
     db.delete(session)
-    db.commit()
+    db.flush()
 
 def delete_expired_sessions(db: Session) -> int:
     """Delete all expired sessions"""
@@ -248,6 +425,9 @@ def verify_session(db: Session, session_id: str) -> Optional[DBSession]:
     """
     Verify session
     
+    Expired sessions are left in place and removed by the periodic
+    delete_expired_sessions sweep, so verification never writes.
+    
     Returns:
         DBSession if valid, otherwise None
     """
@@ -257,7 +437,6 @@ def verify_session(db: Session, session_id: str) -> Optional[DBSession]:
         return None
     
     if session.is_expired():
-        delete_session(db, session)
         return None
     
     return session
@@ -274,18 +453,17 @@ def create_audit_log(
     ip_address: Optional[str] = None
 ) -> AuditLog:
     """Create audit log"""
-    log = AuditLog(
-        user_id=user_id,
-        action=action,
-        resource=resource,
-        details=details,
-        ip_address=ip_address,
-        success=success
-    )
-    
-    db.add(log)
-    db.commit()
-    db.refresh(log)
+    log = db.execute(
+        insert(AuditLog).values(
+            user_id=user_id,
+            action=action,
+            resource=resource,
+            details=details,
+            ip_address=ip_address,
+            success=success
+        ).returning(AuditLog)
+    ).scalar_one()
+    _commit_returning(db, log)
     
     return log
 
@@ -307,6 +485,36 @@ def get_audit_logs(
     
     return query.order_by(AuditLog.created_at.desc()).offset(skip).limit(limit).all()
 
+def stream_audit_logs(
+    db: Session,
+    user_id: Optional[int] = None,
+    action: Optional[str] = None,
+    batch_size: int = 1000
+) -> Iterator[AuditLog]:
+    """
+    Iterate over audit logs without loading the whole table
+    
+    Rows are fetched through a server-side cursor (where the driver supports
+    it) in batches of batch_size, newest first.
+    
+    Args:
+        db: Database session
+        user_id: Only logs of this user (optional)
+        action: Only logs with this action (optional)
+        batch_size: Rows fetched per round-trip
+    """
+    stmt = select(AuditLog).options(joinedload(AuditLog.user))
+    
+    if user_id is not None:
+        stmt = stmt.where(AuditLog.user_id == user_id)
+    
+    if action is not None:
+        stmt = stmt.where(AuditLog.action == action)
+    
+    stmt = stmt.order_by(AuditLog.created_at.desc()).execution_options(stream_results=True)
+    
+    yield from db.execute(stmt).yield_per(batch_size).scalars()
+
 def delete_old_audit_logs(db: Session, days: int = 90) -> int:
     """Delete old audit logs"""
     cutoff_date = datetime.utcnow() - timedelta(days=days)
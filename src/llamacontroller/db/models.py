@@ -1,19 +1,143 @@
 """
 Database model definitions
 """
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, Index, LargeBinary, event, text
+from sqlalchemy.dialects.postgresql import INET
 from sqlalchemy.orm import relationship
+from sqlalchemy.types import TypeDecorator
 from sqlalchemy.sql import func
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional
+import ipaddress
+import logging
+import time
 
 from llamacontroller.db.base import Base
 
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+def _now_ts() -> int:
+    """Current Unix time in whole seconds"""
+    return int(time.time())
+
+
+def _utc_ts(value: Optional[datetime]) -> Optional[int]:
+    """
+    Convert a naive UTC datetime column value to Unix seconds
+    
+    Args:
+        value: Column value
+        
+    Returns:
+        Unix seconds, or None if the column is NULL
+    """
+    if value is None:
+        return None
+    return int(value.replace(tzinfo=timezone.utc).timestamp())
+
+
+def _cache_ts(cls, column: str, cache_attr: str) -> None:
+    """
+    Keep a Unix-seconds copy of a DateTime column in instance.__dict__
+    
+    The copy is computed when the row is loaded or refreshed and when the
+    column is assigned, and dropped when the column is expired, so the
+    is_expired()/is_locked() checks compare two ints without any datetime
+    work. If the copy is missing the check converts the column directly.
+    
+    Args:
+        cls: Mapped class
+        column: Name of the DateTime column
+        cache_attr: Instance attribute that holds the Unix seconds
+    """
+    def on_load(target, context):
+        if column in target.__dict__:
+            target.__dict__[cache_attr] = _utc_ts(target.__dict__[column])
+    
+    def on_refresh(target, context, attrs):
+        if attrs is None or column in attrs:
+            on_load(target, context)
+    
+    def on_expire(target, attrs):
+        if attrs is None or column in attrs:
+            target.__dict__.pop(cache_attr, None)
+    
+    def on_set(target, value, oldvalue, initiator):
+        target.__dict__[cache_attr] = _utc_ts(value)
+    
+    event.listen(cls, 'load', on_load)
+    event.listen(cls, 'refresh', on_refresh)
+    event.listen(cls, 'expire', on_expire)
+    event.listen(getattr(cls, column), 'set', on_set)
+
+
+class _PackedOrText(LargeBinary):
+    """BLOB column that also binds plain strings, stored as TEXT"""
+    
+    def bind_processor(self, dialect):
+        process = super().bind_processor(dialect)
+        if process is None:
+            return None
+        
+        def bind(value):
+            if isinstance(value, str):
+                return value
+            return process(value)
+        return bind
+
+
+class IPAddress(TypeDecorator):
+    """
+    IP address column
+    
+    Stored as INET on PostgreSQL and as packed bytes (4 bytes IPv4, 16 bytes
+    IPv6) elsewhere; always read back as a string. Values that are not valid
+    IP addresses (e.g. "testclient", a unix socket path) are kept as text
+    where the column allows it; INET can't hold them, so on PostgreSQL they
+    are stored as NULL.
+    
+    No migration is needed for databases created by older releases, which
+    declared the column as VARCHAR(45): create_all() leaves existing columns
+    alone, new rows bind as bytes (SQLite) or text (PostgreSQL), both of which
+    the existing column accepts, and old text rows are returned unchanged.
+    """
+    impl = LargeBinary(16)
+    cache_ok = True
+    
+    def load_dialect_impl(self, dialect):
+        if dialect.name == 'postgresql':
+            return dialect.type_descriptor(INET())
+        return dialect.type_descriptor(_PackedOrText(16))
+    
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        try:
+            address = ipaddress.ip_address(value)
+        except ValueError:
+            if dialect.name == 'postgresql':
+                logger.debug(f"Storing NULL for non-IP client address: {value!r}")
+                return None
+            return value
+        if dialect.name == 'postgresql':
+            return str(address)
+        return address.packed
+    
+    def process_result_value(self, value, dialect):
+        if value is None or isinstance(value, str):
+            return value
+        # psycopg3 and asyncpg return INET values as ipaddress objects
+        if isinstance(value, (ipaddress.IPv4Address, ipaddress.IPv6Address)):
+            return str(value)
+        return str(ipaddress.ip_address(bytes(value)))
+
 
 class User(Base):
     """User model"""
     __tablename__ = "users"
-    __table_args__ = {'extend_existing': True}
     
     id = Column(Integer, primary_key=True, index=True)
     username = Column(String(50), unique=True, nullable=False, index=True)
@@ -35,9 +159,12 @@ class User(Base):
     
     def is_locked(self) -> bool:
         """Check if user is locked"""
-        if self.locked_until is None:
+        locked_ts = self.__dict__.get('_locked_ts', _MISSING)
+        if locked_ts is _MISSING:
+            locked_ts = _utc_ts(self.locked_until)
+        if locked_ts is None:
             return False
-        return datetime.utcnow() < self.locked_until
+        return _now_ts() < locked_ts
     
     def is_admin(self) -> bool:
         """Check if user is admin"""
@@ -47,7 +174,15 @@ class User(Base):
 class APIToken(Base):
     """API token model"""
     __tablename__ = "api_tokens"
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        # Partial index over live tokens only, used by the token verification lookup
+        Index(
+            'ix_api_tokens_active_token_hash',
+            'token_hash',
+            postgresql_where=text('is_active'),
+            sqlite_where=text('is_active = 1'),
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -66,9 +201,12 @@ class APIToken(Base):
     
     def is_expired(self) -> bool:
         """Check if token is expired"""
-        if self.expires_at is None:
+        expires_ts = self.__dict__.get('_expires_ts', _MISSING)
+        if expires_ts is _MISSING:
+            expires_ts = _utc_ts(self.expires_at)
+        if expires_ts is None:
             return False
-        return datetime.utcnow() > self.expires_at
+        return _now_ts() > expires_ts
     
     def is_valid(self) -> bool:
         """Check if token is valid"""
@@ -78,14 +216,13 @@ class APIToken(Base):
 class Session(Base):
     """Session model"""
     __tablename__ = "sessions"
-    __table_args__ = {'extend_existing': True}
     
     id = Column(Integer, primary_key=True, index=True)
     session_id = Column(String(255), unique=True, nullable=False, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     created_at = Column(DateTime, nullable=False, default=func.now())
     expires_at = Column(DateTime, nullable=False)
-    ip_address = Column(String(45), nullable=True)  # IPv4 or IPv6
+    ip_address = Column(IPAddress, nullable=True)  # IPv4 or IPv6
     user_agent = Column(Text, nullable=True)
     
     # Relationships
@@ -96,7 +233,10 @@ class Session(Base):
     
     def is_expired(self) -> bool:
         """Check if session is expired"""
-        return datetime.utcnow() > self.expires_at
+        expires_ts = self.__dict__.get('_expires_ts', _MISSING)
+        if expires_ts is _MISSING:
+            expires_ts = _utc_ts(self.expires_at)
+        return _now_ts() > expires_ts
     
     @classmethod
     def create_expires_at(cls, timeout_seconds: int = 3600) -> datetime:
@@ -104,17 +244,26 @@ class Session(Base):
         return datetime.utcnow() + timedelta(seconds=timeout_seconds)
 
 
+_cache_ts(User, 'locked_until', '_locked_ts')
+_cache_ts(APIToken, 'expires_at', '_expires_ts')
+_cache_ts(Session, 'expires_at', '_expires_ts')
+
+
 class AuditLog(Base):
     """Audit log model"""
     __tablename__ = "audit_logs"
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        # Composite indexes matching get_audit_logs() filters + newest-first order
+        Index('ix_audit_logs_user_created', 'user_id', text('created_at DESC')),
+        Index('ix_audit_logs_action_created', 'action', text('created_at DESC')),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=True)  # Optional, null for anonymous operations
-    action = Column(String(50), nullable=False, index=True)  # login, logout, load_model, etc.
+    action = Column(String(50), nullable=False)  # login, logout, load_model, etc. (indexed via ix_audit_logs_action_created)
     resource = Column(String(100), nullable=True)  # model_id, token_id, etc.
     details = Column(Text, nullable=True)  # Additional information in JSON format
-    ip_address = Column(String(45), nullable=True)
+    ip_address = Column(IPAddress, nullable=True)
     created_at = Column(DateTime, nullable=False, default=func.now(), index=True)
     success = Column(Boolean, nullable=False, default=True)
     
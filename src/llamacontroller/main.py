@@ -2,25 +2,71 @@
 LlamaController FastAPI application entry point.
 """
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from pathlib import Path
-from fastapi import FastAPI, Request, status
+from typing import Optional
+
+import orjson
+from fastapi import FastAPI, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, RedirectResponse, HTMLResponse
 from fastapi.exceptions import HTTPException
 from fastapi.staticfiles import StaticFiles
 from fastapi.openapi.docs import get_swagger_ui_html, get_redoc_html
 
-from .api import management, ollama, auth, tokens, users, gpu
+from .api import management, ollama, auth, tokens, users, gpu, audit
 from .web import routes as web_routes
 from .api.dependencies import initialize_managers
+from .api.responses import OrjsonResponse
+from llamacontroller.db import crud
+from llamacontroller.db.base import SessionLocal
 from .utils.logging import setup_logging
 
 # Setup logging
 setup_logging()
 logger = logging.getLogger(__name__)
 
+# Interval between expired session sweeps (seconds)
+SESSION_CLEANUP_INTERVAL = 60
+
+# Interval between API token last_used_at flushes (seconds)
+TOKEN_USAGE_FLUSH_INTERVAL = 5
+
+def _delete_expired_sessions() -> None:
+    """Delete expired sessions using a dedicated database session."""
+    db = SessionLocal()
+    try:
+        count = crud.delete_expired_sessions(db)
+        if count:
+            logger.info(f"Deleted {count} expired sessions")
+    finally:
+        db.close()
+
+def _flush_token_usage() -> None:
+    """Write buffered API token last_used_at values using a dedicated database session."""
+    db = SessionLocal()
+    try:
+        crud.flush_api_token_last_used(db)
+    finally:
+        db.close()
+
+async def _run_periodically(func, interval: float) -> None:
+    """
+    Run a blocking database maintenance function in a worker thread every interval seconds.
+    
+    Session verification no longer deletes expired rows and token verification
+    no longer writes last_used_at, so these background tasks take over that work.
+    """
+    while True:
+        try:
+            await asyncio.to_thread(func)
+        except Exception as e:
+            logger.error(f"Background task {func.__name__} failed: {e}")
+        
+        await asyncio.sleep(interval)
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -39,10 +85,25 @@ async def lifespan(app: FastAPI):
         logger.error(f"Failed to initialize managers: {e}")
         raise
     
+    # Start background database maintenance
+    background_tasks = [
+        asyncio.create_task(_run_periodically(_delete_expired_sessions, SESSION_CLEANUP_INTERVAL)),
+        asyncio.create_task(_run_periodically(_flush_token_usage, TOKEN_USAGE_FLUSH_INTERVAL)),
+    ]
+    
     yield
     
     # Shutdown
     logger.info("Shutting down LlamaController...")
+    for task in background_tasks:
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    
+    # Persist any token usage still buffered
+    try:
+        _flush_token_usage()
+    except Exception as e:
+        logger.error(f"Failed to flush token usage on shutdown: {e}")
 
 # Create FastAPI application with custom docs URLs for air-gap environments
 app = FastAPI(
@@ -50,8 +111,10 @@ app = FastAPI(
     description="WebUI-based management system for llama.cpp model lifecycle with Ollama API compatibility",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=OrjsonResponse,
     docs_url=None,  # Disable default docs
     redoc_url=None,  # Disable default redoc
+    openapi_url=None,  # Served from cached bytes below
 )
 
 # Configure CORS
@@ -75,10 +138,36 @@ app.include_router(web_routes.router)
 app.include_router(auth.router)
 app.include_router(tokens.router)
 app.include_router(users.router)
+app.include_router(audit.router)
 app.include_router(management.router)
 app.include_router(gpu.router)
 app.include_router(ollama.router)
 
+# Static part of the root response
+_ROOT_INFO = {
+    "name": "LlamaController",
+    "version": "0.1.0",
+    "description": "llama.cpp model lifecycle management with Ollama API compatibility",
+    "endpoints": {
+        "management": "/api/v1",
+        "ollama_compatible": "/api",
+        "docs": "/docs",
+        "openapi": "/openapi.json"
+    }
+}
+
+# Root response while llama-server is stopped, encoded once
+_ROOT_STOPPED_BYTES = orjson.dumps({
+    **_ROOT_INFO,
+    "llama_server": {
+        "status": "stopped",
+        "message": "Load a model to start llama-server"
+    }
+})
+
+# Encoded OpenAPI schema, built on first request once all routes exist
+_openapi_bytes: Optional[bytes] = None
+
 @app.get("/")
 async def root():
     """Root endpoint with API information."""
@@ -88,33 +177,27 @@ async def root():
     lifecycle = get_lifecycle_manager()
     status = await lifecycle.get_status()
     
-    response = {
-        "name": "LlamaController",
-        "version": "0.1.0",
-        "description": "llama.cpp model lifecycle management with Ollama API compatibility",
-        "endpoints": {
-            "management": "/api/v1",
-            "ollama_compatible": "/api",
-            "docs": "/docs",
-            "openapi": "/openapi.json"
-        }
-    }
-    
     # Add llama-server URL if running
     if status.status == "running" and status.host and status.port:
-        response["llama_server"] = {
-            "status": "running",
-            "url": f"http://{status.host}:{status.port}",
-            "web_interface": f"http://{status.host}:{status.port}",
-            "model": status.model_name or status.model_id
-        }
-    else:
-        response["llama_server"] = {
-            "status": "stopped",
-            "message": "Load a model to start llama-server"
+        return {
+            **_ROOT_INFO,
+            "llama_server": {
+                "status": "running",
+                "url": f"http://{status.host}:{status.port}",
+                "web_interface": f"http://{status.host}:{status.port}",
+                "model": status.model_name or status.model_id
+            }
         }
     
-    return response
+    return Response(content=_ROOT_STOPPED_BYTES, media_type="application/json")
+
+@app.get("/openapi.json", include_in_schema=False)
+async def openapi_json():
+    """OpenAPI schema, encoded once and served from cache."""
+    global _openapi_bytes
+    if _openapi_bytes is None:
+        _openapi_bytes = orjson.dumps(app.openapi())
+    return Response(content=_openapi_bytes, media_type="application/json")
 
 @app.get("/health")
 async def health():
@@ -1 +1,20 @@
 """Pydantic models for data validation."""
+
+import importlib
+
+# Resolved on first access so importing a submodule doesn't build every schema
+_LAZY_EXPORTS = {
+    "LocalModelInfo": ".lifecycle",
+    "OllamaModelInfo": ".ollama",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
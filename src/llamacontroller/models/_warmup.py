@@ -0,0 +1,28 @@
+"""
+Import-time schema building for Pydantic models.
+"""
+
+from typing import Any, Dict
+
+from pydantic import BaseModel
+
+
+def materialize(namespace: Dict[str, Any]) -> None:
+    """
+    Finish schema building for the models defined in a module.
+
+    Once a model is complete its validator and serializer are real
+    pydantic-core objects, so the first request doesn't pay for them.
+    Models that opt into defer_build are skipped on purpose; they are
+    built on first use instead.
+
+    Args:
+        namespace: The calling module's globals()
+    """
+    module_name = namespace["__name__"]
+    for obj in list(namespace.values()):
+        if not (isinstance(obj, type) and issubclass(obj, BaseModel)):
+            continue
+        if obj.__module__ != module_name or obj.model_config.get("defer_build"):
+            continue
+        obj.model_rebuild()
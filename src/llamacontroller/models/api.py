@@ -1,31 +1,16 @@
 """
 Pydantic models for API request/response schemas.
+
+Load/unload/switch requests and the health check response are defined once
+in models.lifecycle.
 """
 
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any
 from datetime import datetime
 from pydantic import BaseModel, Field, ConfigDict
 
 # Management API Models (LlamaController specific)
 
-class LoadModelRequest(BaseModel):
-    """Request to load a model."""
-    model_config = ConfigDict(protected_namespaces=())
-    
-    model_id: str = Field(..., description="ID of the model to load")
-    gpu_id: Union[int, str] = Field(0, description="GPU ID (0, 1, or 'both')")
-
-class UnloadModelRequest(BaseModel):
-    """Request to unload current model."""
-    gpu_id: Union[int, str] = Field(..., description="GPU ID (0, 1, or 'both')")
-
-class SwitchModelRequest(BaseModel):
-    """Request to switch to a different model."""
-    model_config = ConfigDict(protected_namespaces=())
-    
-    model_id: str = Field(..., description="ID of the model to switch to")
-    gpu_id: Union[int, str] = Field(0, description="GPU ID (0, 1, or 'both')")
-
 class ModelInfoResponse(BaseModel):
     """Information about a model."""
     id: str
@@ -52,13 +37,6 @@ class ModelStatusResponse(BaseModel):
     port: Optional[int]
     server_url: Optional[str] = Field(None, description="URL to llama-server web interface")
 
-class HealthCheckResponse(BaseModel):
-    """Health check response."""
-    healthy: bool
-    status: str
-    message: str
-    uptime_seconds: Optional[float]
-
 class ListModelsResponse(BaseModel):
     """Response listing available models."""
     models: List[ModelInfoResponse]
@@ -1,57 +1,44 @@
 """
 Authentication-related Pydantic models
 """
-from pydantic import BaseModel, Field, validator
-from typing import Optional, List
+from pydantic import BaseModel, ConfigDict, Field, SecretStr
+from typing import Optional, List, Literal
 from datetime import datetime
 
+from ._warmup import materialize
+
 # ==================== Request Models ====================
 
 class LoginRequest(BaseModel):
     """Login request"""
     username: str = Field(..., min_length=1, max_length=50, description="Username")
-    password: str = Field(..., min_length=1, description="Password")
+    password: SecretStr = Field(..., min_length=1, max_length=128, description="Password")
 
 class ChangePasswordRequest(BaseModel):
     """Change password request"""
-    old_password: str = Field(..., min_length=1, description="Old password")
-    new_password: str = Field(..., min_length=8, description="New password")
-    
-    @validator('new_password')
-    def validate_password_strength(cls, v):
-        """Validate password strength"""
-        if len(v) < 8:
-            raise ValueError("Password must be at least 8 characters")
-        return v
+    old_password: SecretStr = Field(..., min_length=1, max_length=128, description="Old password")
+    new_password: SecretStr = Field(..., min_length=8, max_length=128, description="New password")
 
 class CreateUserRequest(BaseModel):
     """Create user request (admin)"""
     username: str = Field(..., min_length=1, max_length=50, description="Username")
     password: str = Field(..., min_length=8, description="Password")
-    role: str = Field(default="user", description="Role: admin or user")
-    
-    @validator('role')
-    def validate_role(cls, v):
-        """Validate role"""
-        if v not in ["admin", "user"]:
-            raise ValueError("Role must be admin or user")
-        return v
+    role: Literal["admin", "user"] = Field(default="user", description="Role: admin or user")
 
 class UpdateUserRequest(BaseModel):
     """Update user request (admin)"""
     is_active: Optional[bool] = Field(None, description="Is active")
-    role: Optional[str] = Field(None, description="Role")
-    
-    @validator('role')
-    def validate_role(cls, v):
-        """Validate role"""
-        if v is not None and v not in ["admin", "user"]:
-            raise ValueError("Role must be admin or user")
-        return v
+    role: Optional[Literal["admin", "user"]] = Field(None, description="Role: admin or user")
 
 class CreateTokenRequest(BaseModel):
     """Create API token request"""
-    name: str = Field(..., min_length=1, max_length=100, description="Token name")
+    name: str = Field(
+        ...,
+        min_length=1,
+        max_length=100,
+        pattern=r"^[\w \-.]{1,100}$",
+        description="Token name (letters, digits, spaces, '_', '-' and '.')",
+    )
     expires_days: Optional[int] = Field(None, gt=0, le=365, description="Expiry days (1-365)")
 
 class UpdateTokenRequest(BaseModel):
@@ -71,8 +58,7 @@ class UserResponse(BaseModel):
     failed_login_attempts: int
     locked_until: Optional[datetime]
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(frozen=True, extra="ignore", from_attributes=True)
 
 class LoginResponse(BaseModel):
     """Login response"""
@@ -80,6 +66,8 @@ class LoginResponse(BaseModel):
     session_id: str
     expires_at: datetime
     message: str = "Login successful"
+    
+    model_config = ConfigDict(frozen=True, extra="ignore", from_attributes=True)
 
 class TokenResponse(BaseModel):
     """Token response"""
@@ -91,18 +79,21 @@ class TokenResponse(BaseModel):
     expires_at: Optional[datetime]
     is_active: bool
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(frozen=True, extra="ignore", from_attributes=True)
 
 class TokenListResponse(BaseModel):
     """Token list response"""
     tokens: List[TokenResponse]
     total: int
+    
+    model_config = ConfigDict(defer_build=True)
 
 class UserListResponse(BaseModel):
     """User list response"""
     users: List[UserResponse]
     total: int
+    
+    model_config = ConfigDict(defer_build=True)
 
 class SessionInfo(BaseModel):
     """Session information"""
@@ -112,8 +103,7 @@ class SessionInfo(BaseModel):
     expires_at: datetime
     ip_address: Optional[str]
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 class CurrentUserResponse(BaseModel):
     """Current user information response"""
@@ -132,13 +122,14 @@ class AuditLogResponse(BaseModel):
     created_at: datetime
     success: bool
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(frozen=True, extra="ignore", from_attributes=True, defer_build=True)
 
 class AuditLogListResponse(BaseModel):
     """Audit log list response"""
     logs: List[AuditLogResponse]
     total: int
+    
+    model_config = ConfigDict(defer_build=True)
 
 # ==================== Common Responses ====================
 
@@ -152,3 +143,6 @@ class ErrorResponse(BaseModel):
     error: str
     detail: Optional[str] = None
     success: bool = False
+
+# Finish schema building at import so the first request doesn't pay for it
+materialize(globals())
@@ -5,7 +5,7 @@ Pydantic models for configuration validation.
 """
 
 from typing import List, Optional, Dict, Any, Union, Literal
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, TypeAdapter, field_validator, model_validator
 from pathlib import Path
 
 class GpuPortsConfig(BaseModel):
@@ -14,6 +14,8 @@ class GpuPortsConfig(BaseModel):
     gpu0: int = Field(default=8081, ge=1, le=65535, description="Port for GPU 0")
     gpu1: int = Field(default=8088, ge=1, le=65535, description="Port for GPU 1")
     both: int = Field(default=8081, ge=1, le=65535, description="Port when using both GPUs")
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
 class GpuDetectionConfig(BaseModel):
     """GPU detection configuration."""
@@ -22,6 +24,8 @@ class GpuDetectionConfig(BaseModel):
     memory_threshold_mb: int = Field(default=30, ge=1, description="Memory threshold in MB to consider GPU occupied")
     mock_mode: bool = Field(default=False, description="Enable mock mode for testing without nvidia-smi")
     mock_data_path: str = Field(default="data/gpu.txt", description="Path to mock nvidia-smi output file")
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
 class LlamaCppConfig(BaseModel):
     """Configuration for llama.cpp executable."""
@@ -60,6 +64,8 @@ class LlamaCppConfig(BaseModel):
         if v.lower() not in valid_levels:
             raise ValueError(f"Invalid log level: {v}. Must be one of {valid_levels}")
         return v.lower()
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
 class ModelParameters(BaseModel):
     """
@@ -156,6 +162,8 @@ class ModelParameters(BaseModel):
             args.extend(["--repeat-penalty", str(self.repeat_penalty)])
         
         return args
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
 class ModelMetadata(BaseModel):
     """Metadata about a model."""
@@ -165,6 +173,8 @@ class ModelMetadata(BaseModel):
     quantization: str = Field(default="", description="Quantization type (e.g., 'Q4_K_M')")
     family: str = Field(default="", description="Model family (e.g., 'llama', 'mistral')")
     capabilities: List[str] = Field(default_factory=list, description="Model capabilities")
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
 class GpuConfig(BaseModel):
     """GPU configuration for model loading."""
@@ -181,6 +191,8 @@ class GpuConfig(BaseModel):
         if v not in [0, 1]:
             raise ValueError("GPU ID must be 0 or 1")
         return v
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
 class ModelConfig(BaseModel):
     """Configuration for a single model."""
@@ -215,21 +227,25 @@ class ModelConfig(BaseModel):
         if not all(c.isalnum() or c in "-_" for c in v):
             raise ValueError("Model ID can only contain alphanumeric characters, hyphens, and underscores")
         return v
-
-    class Config:
-        protected_namespaces = ()
+    
+    model_config = ConfigDict(frozen=True, extra="forbid", protected_namespaces=())
 
 class ModelsConfig(BaseModel):
     """Configuration for all models."""
     
     models: List[ModelConfig] = Field(default_factory=list, description="List of configured models")
     
+    _by_id: Dict[str, ModelConfig] = PrivateAttr(default_factory=dict)
+    
+    @model_validator(mode="after")
+    def _build_index(self) -> "ModelsConfig":
+        """Index models by ID once so lookups are O(1)."""
+        self._by_id = {model.id: model for model in self.models}
+        return self
+    
     def get_model(self, model_id: str) -> Optional[ModelConfig]:
         """Get model configuration by ID."""
-        for model in self.models:
-            if model.id == model_id:
-                return model
-        return None
+        return self._by_id.get(model_id)
     
     def get_model_ids(self) -> List[str]:
         """Get list of all model IDs."""
@@ -244,9 +260,8 @@ class ModelsConfig(BaseModel):
             duplicates = [id for id in ids if ids.count(id) > 1]
             raise ValueError(f"Duplicate model IDs found: {set(duplicates)}")
         return v
-
-    class Config:
-        protected_namespaces = ()
+    
+    model_config = ConfigDict(frozen=True, extra="forbid", protected_namespaces=())
 
 class AuthUser(BaseModel):
     """User configuration for authentication."""
@@ -264,6 +279,8 @@ class AuthUser(BaseModel):
         if not v.isalnum():
             raise ValueError("Username can only contain alphanumeric characters")
         return v
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
 class AuthConfig(BaseModel):
     """Configuration for authentication."""
@@ -273,12 +290,20 @@ class AuthConfig(BaseModel):
     lockout_duration: int = Field(default=300, ge=0, description="Lockout duration in seconds")
     users: List[AuthUser] = Field(default_factory=list, description="Configured users")
     
+    _by_username: Dict[str, AuthUser] = PrivateAttr(default_factory=dict)
+    
+    @model_validator(mode="after")
+    def _build_index(self) -> "AuthConfig":
+        """Index users by username once so lookups are O(1)."""
+        # Reversed so the first entry wins on duplicate usernames, as before
+        self._by_username = {user.username: user for user in reversed(self.users)}
+        return self
+    
     def get_user(self, username: str) -> Optional[AuthUser]:
         """Get user by username."""
-        for user in self.users:
-            if user.username == username:
-                return user
-        return None
+        return self._by_username.get(username)
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
 class AppConfig(BaseModel):
     """Main application configuration combining all configs."""
@@ -287,7 +312,9 @@ class AppConfig(BaseModel):
     models: ModelsConfig
     auth: AuthConfig
     
-    class Config:
-        """Pydantic configuration."""
-        arbitrary_types_allowed = True
-        protected_namespaces = ()
+    model_config = ConfigDict(frozen=True, extra="forbid", arbitrary_types_allowed=True, protected_namespaces=())
+
+# Validators for the per-file config sections, built once at import
+LLAMA_CPP_CONFIG_ADAPTER = TypeAdapter(LlamaCppConfig)
+MODELS_CONFIG_ADAPTER = TypeAdapter(ModelsConfig)
+AUTH_CONFIG_ADAPTER = TypeAdapter(AuthConfig)
@@ -2,11 +2,13 @@
 Pydantic models for model lifecycle management.
 """
 
-from typing import Optional, Union, Dict
+from typing import List, Optional, Union
 from datetime import datetime
 from enum import Enum
 from pydantic import BaseModel, Field
 
+from ._warmup import materialize
+
 
 class ProcessStatus(str, Enum):
     """llama.cpp process status enumeration"""
@@ -18,7 +20,20 @@ class ProcessStatus(str, Enum):
     ERROR = "error"
 
 
-class ModelStatus(BaseModel):
+class LifecycleBase(BaseModel):
+    """Shared config for lifecycle models"""
+    model_config = {
+        "protected_namespaces": (),  # Allow model_ prefix
+        "use_enum_values": True,
+    }
+
+
+class FrozenLifecycleBase(LifecycleBase):
+    """Shared config for lifecycle status and response models (immutable)"""
+    model_config = {"frozen": True}
+
+
+class ModelStatus(FrozenLifecycleBase):
     """Model status information"""
     model_id: Optional[str] = Field(None, description="Currently loaded model ID")
     model_name: Optional[str] = Field(None, description="Currently loaded model name")
@@ -29,14 +44,9 @@ class ModelStatus(BaseModel):
     pid: Optional[int] = Field(None, description="Process ID")
     host: Optional[str] = Field(None, description="Service host")
     port: Optional[int] = Field(None, description="Service port")
-    
-    model_config = {
-        "use_enum_values": True,
-        "protected_namespaces": ()  # Allow model_ prefix
-    }
 
 
-class GpuInstanceStatus(BaseModel):
+class GpuInstanceStatus(FrozenLifecycleBase):
     """Single GPU instance status"""
     gpu_id: Union[int, str] = Field(..., description="GPU ID (0, 1, or 'both')")
     port: int = Field(..., description="Service port")
@@ -48,36 +58,32 @@ class GpuInstanceStatus(BaseModel):
     pid: Optional[int] = Field(None, description="Process ID")
     memory_used_mb: Optional[int] = Field(None, description="GPU memory used (MiB)")
     memory_total_mb: Optional[int] = Field(None, description="Total GPU memory (MiB)")
-    
-    model_config = {
-        "use_enum_values": True,
-        "protected_namespaces": ()
-    }
-
-class AllGpuStatus(BaseModel):
-    """Status of all GPUs"""
-    gpu0: Optional[GpuInstanceStatus] = Field(None, description="GPU 0 status")
-    gpu1: Optional[GpuInstanceStatus] = Field(None, description="GPU 1 status")
-    both: Optional[GpuInstanceStatus] = Field(None, description="Both GPUs status")
-    
-    model_config = {"protected_namespaces": ()}
 
-class LoadModelRequest(BaseModel):
+class AllGpuStatus(FrozenLifecycleBase):
+    """Status of all loaded GPU instances, one column per field (index i = instance i)"""
+    gpu_ids: List[Union[int, str]] = Field(default_factory=list, description="GPU IDs (e.g. '0', '1', '0,1')")
+    ports: List[int] = Field(default_factory=list, description="Service ports")
+    model_ids: List[Optional[str]] = Field(default_factory=list, description="Loaded model IDs")
+    model_names: List[Optional[str]] = Field(default_factory=list, description="Loaded model names")
+    statuses: List[ProcessStatus] = Field(default_factory=list, description="Process statuses")
+    loaded_at: List[Optional[datetime]] = Field(default_factory=list, description="Load times")
+    uptime_seconds: List[Optional[int]] = Field(default_factory=list, description="Uptimes (seconds)")
+    pids: List[Optional[int]] = Field(default_factory=list, description="Process IDs")
+    memory_used_mb: List[Optional[int]] = Field(default_factory=list, description="GPU memory used (MiB)")
+    memory_total_mb: List[Optional[int]] = Field(default_factory=list, description="Total GPU memory (MiB)")
+
+class LoadModelRequest(LifecycleBase):
     """Load model request"""
     model_id: str = Field(..., description="Model ID to load")
     gpu_id: Union[int, str] = Field(0, description="GPU ID (0, 1, or 'both')")
-    
-    model_config = {"protected_namespaces": ()}
 
 
-class LoadModelResponse(BaseModel):
+class LoadModelResponse(FrozenLifecycleBase):
     """Load model response"""
     success: bool = Field(..., description="Operation success")
     model_id: str = Field(..., description="Model ID")
     message: str = Field(..., description="Result message")
     status: ModelStatus = Field(..., description="Model status")
-    
-    model_config = {"protected_namespaces": ()}
 
 
 class UnloadModelResponse(BaseModel):
@@ -86,30 +92,26 @@ class UnloadModelResponse(BaseModel):
     message: str = Field(..., description="Result message")
 
 
-class UnloadModelRequest(BaseModel):
+class UnloadModelRequest(LifecycleBase):
     """Unload model request"""
     gpu_id: Union[int, str] = Field(..., description="GPU ID (0, 1, or 'both')")
 
-class SwitchModelRequest(BaseModel):
+class SwitchModelRequest(LifecycleBase):
     """Switch model request"""
     model_id: str = Field(..., description="Model ID to switch to")
     gpu_id: Union[int, str] = Field(0, description="GPU ID (0, 1, or 'both')")
-    
-    model_config = {"protected_namespaces": ()}
 
 
-class SwitchModelResponse(BaseModel):
+class SwitchModelResponse(FrozenLifecycleBase):
     """Switch model response"""
     success: bool = Field(..., description="Operation success")
     old_model_id: Optional[str] = Field(None, description="Previous model ID")
     new_model_id: str = Field(..., description="New model ID")
     message: str = Field(..., description="Result message")
     status: ModelStatus = Field(..., description="New model status")
-    
-    model_config = {"protected_namespaces": ()}
 
 
-class ModelInfo(BaseModel):
+class LocalModelInfo(BaseModel):
     """Model information"""
     id: str = Field(..., description="Model ID")
     name: str = Field(..., description="Model name")
@@ -127,3 +129,8 @@ class HealthCheckResponse(BaseModel):
     status: ProcessStatus = Field(..., description="Process status")
     message: str = Field(..., description="Status message")
     uptime_seconds: Optional[int] = Field(None, description="Uptime")
+    
+    model_config = {"frozen": True, "extra": "ignore"}
+
+# Finish schema building at import so the first request doesn't pay for it
+materialize(globals())
@@ -5,17 +5,30 @@ Based on Ollama API specification.
 
 from typing import Optional, List, Dict, Any, Literal
 from datetime import datetime
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
+
+from ._warmup import materialize
 
 # Ollama API Models
 
+class OllamaOptions(BaseModel):
+    """Model parameters accepted in the ``options`` field; unknown keys are kept."""
+    temperature: Optional[float] = None
+    top_p: Optional[float] = None
+    top_k: Optional[int] = None
+    num_predict: Optional[int] = None
+    seed: Optional[int] = None
+    stop: Optional[List[str]] = None
+    
+    model_config = ConfigDict(frozen=True, extra="allow")
+
 class GenerateRequest(BaseModel):
     """Request for text generation (Ollama /api/generate endpoint)."""
     model: str = Field(..., description="Model name to use for generation")
     prompt: str = Field(..., description="The prompt to generate a response for")
     images: Optional[List[str]] = Field(None, description="Base64 encoded images for multimodal models")
     format: Optional[Literal["json"]] = Field(None, description="Format of the response (json)")
-    options: Optional[Dict[str, Any]] = Field(None, description="Additional model parameters")
+    options: Optional[OllamaOptions] = Field(None, description="Additional model parameters")
     system: Optional[str] = Field(None, description="System message to use")
     template: Optional[str] = Field(None, description="Prompt template to use")
     context: Optional[List[int]] = Field(None, description="Context from previous generation")
@@ -26,7 +39,7 @@ class GenerateRequest(BaseModel):
 class GenerateResponse(BaseModel):
     """Response for text generation."""
     model: str
-    created_at: str
+    created_at: datetime
     response: str
     done: bool
     context: Optional[List[int]] = None
@@ -36,6 +49,8 @@ class GenerateResponse(BaseModel):
     prompt_eval_duration: Optional[int] = None
     eval_count: Optional[int] = None
     eval_duration: Optional[int] = None
+    
+    model_config = ConfigDict(frozen=True, extra="ignore")
 
 class ChatMessage(BaseModel):
     """A chat message."""
@@ -48,14 +63,14 @@ class ChatRequest(BaseModel):
     model: str = Field(..., description="Model name to use")
     messages: List[ChatMessage] = Field(..., description="List of chat messages")
     format: Optional[Literal["json"]] = Field(None, description="Format of the response")
-    options: Optional[Dict[str, Any]] = Field(None, description="Additional model parameters")
+    options: Optional[OllamaOptions] = Field(None, description="Additional model parameters")
     stream: Optional[bool] = Field(True, description="Whether to stream the response")
     keep_alive: Optional[str] = Field(None, description="How long to keep model loaded")
 
 class ChatResponse(BaseModel):
     """Response for chat completion."""
     model: str
-    created_at: str
+    created_at: datetime
     message: ChatMessage
     done: bool
     total_duration: Optional[int] = None
@@ -64,6 +79,8 @@ class ChatResponse(BaseModel):
     prompt_eval_duration: Optional[int] = None
     eval_count: Optional[int] = None
     eval_duration: Optional[int] = None
+    
+    model_config = ConfigDict(frozen=True, extra="ignore")
 
 class ModelDetails(BaseModel):
     """Details about a model."""
@@ -73,18 +90,18 @@ class ModelDetails(BaseModel):
     parameter_size: str
     quantization_level: str
 
-class ModelInfo(BaseModel):
+class OllamaModelInfo(BaseModel):
     """Information about a model (Ollama /api/tags response item)."""
     name: str
     model: str
-    modified_at: str
+    modified_at: datetime
     size: int
     digest: str
     details: ModelDetails
 
 class TagsResponse(BaseModel):
     """Response for listing models (Ollama /api/tags endpoint)."""
-    models: List[ModelInfo]
+    models: List[OllamaModelInfo]
 
 class ShowRequest(BaseModel):
     """Request to show model information (Ollama /api/show endpoint)."""
@@ -107,13 +124,17 @@ class RunningModel(BaseModel):
     size: int
     digest: str
     details: ModelDetails
-    expires_at: str
+    expires_at: datetime
     size_vram: int
 
 class ProcessResponse(BaseModel):
     """Response for listing running models (Ollama /api/ps endpoint)."""
     models: List[RunningModel]
 
+# Reused adapters for serializing the /api/tags and /api/ps model lists
+MODEL_LIST_ADAPTER = TypeAdapter(List[OllamaModelInfo])
+RUNNING_MODEL_LIST_ADAPTER = TypeAdapter(List[RunningModel])
+
 class PullRequest(BaseModel):
     """Request to pull a model (Ollama /api/pull endpoint)."""
     name: str = Field(..., description="Name of the model to pull")
@@ -172,3 +193,6 @@ class EmbeddingsResponse(BaseModel):
 class ErrorResponse(BaseModel):
     """Standard error response."""
     error: str
+
+# Finish schema building at import so the first request doesn't pay for it
+materialize(globals())
@@ -2,11 +2,27 @@
 Logging configuration and utilities for LlamaController.
 """
 
+import atexit
 import logging
+import queue
 import sys
 from pathlib import Path
 from typing import Optional
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+
+# Background listener that owns the file/console handlers
+_listener: Optional[QueueListener] = None
+
+def _stop_listener() -> None:
+    """Flush queued records, stop the background listener and close its handlers."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+atexit.register(_stop_listener)
 
 def setup_logging(
     log_level: str = "INFO",
@@ -19,6 +35,10 @@ def setup_logging(
     """
     Set up logging configuration for the application.
     
+    Records are put on a queue by the calling thread and written to the
+    file/console handlers by a background QueueListener, so request threads
+    never block on disk I/O or log rotation.
+    
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_dir: Directory for log files. Defaults to './logs'
@@ -37,9 +57,20 @@ def setup_logging(
     # Convert log level string to logging constant
     numeric_level = getattr(logging, log_level.upper(), logging.INFO)
     
+    # Thread/process details are only collected, and source locations only
+    # logged, at DEBUG level
+    debug = numeric_level <= logging.DEBUG
+    logging.logThreads = debug
+    logging.logProcesses = debug
+    logging.logMultiprocessing = debug
+    
     # Create formatters
+    if debug:
+        detailed_fmt = '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s'
+    else:
+        detailed_fmt = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     detailed_formatter = logging.Formatter(
-        fmt='%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s',
+        fmt=detailed_fmt,
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     
@@ -53,7 +84,9 @@ def setup_logging(
     root_logger.setLevel(numeric_level)
     
     # Remove existing handlers
+    _stop_listener()
     root_logger.handlers.clear()
+    handlers = []
     
     # File handler with rotation
     file_handler = RotatingFileHandler(
@@ -64,23 +97,31 @@ def setup_logging(
     )
     file_handler.setLevel(numeric_level)
     file_handler.setFormatter(detailed_formatter)
-    root_logger.addHandler(file_handler)
+    handlers.append(file_handler)
     
     # Console handler
     if console_output:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(numeric_level)
         console_handler.setFormatter(simple_formatter)
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
+    
+    # Route all records through a queue to the background listener
+    global _listener
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setLevel(numeric_level)
+    root_logger.addHandler(queue_handler)
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
     
-    # Log the setup
-    logger = logging.getLogger(__name__)
-    logger.info("=" * 60)
-    logger.info("LlamaController Logging Initialized")
-    logger.info(f"Log Level: {log_level.upper()}")
-    logger.info(f"Log File: {log_path / log_file}")
-    logger.info(f"Console Output: {console_output}")
-    logger.info("=" * 60)
+    # Log the setup as a single record
+    logging.getLogger(__name__).info(
+        "=== LlamaController logging initialized (level=%s file=%s console=%s) ===",
+        log_level.upper(),
+        log_path / log_file,
+        console_output,
+    )
 
 def get_logger(name: str) -> logging.Logger:
     """
@@ -8,14 +8,15 @@ Uses HTMX for dynamic interactions and Jinja2 for server-side rendering.
 import logging
 from typing import Optional
 from fastapi import APIRouter, Request, Depends, Form, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
 
 from ..auth.dependencies import get_current_user_from_session, get_optional_user_from_session
 from ..auth.service import AuthService
-from ..db.base import get_db
-from ..db.models import User
+from llamacontroller.db.base import get_db
+from llamacontroller.db.models import User
 from ..api.dependencies import get_lifecycle_manager
 from ..core.lifecycle import ModelLifecycleManager
 
@@ -82,7 +83,9 @@ async def login_submit(
     user_agent = get_user_agent(request)
     
     # Authenticate user
-    success, error_msg, user = auth_service.authenticate_user(username, password, ip_address)
+    success, error_msg, user = await run_in_threadpool(
+        auth_service.authenticate_user, username, password, ip_address
+    )
     if not success or user is None:
         return templates.TemplateResponse(
             "login.html",
@@ -367,7 +370,7 @@ async def tokens_page(
     db: Session = Depends(get_db)
 ):
     """Display token management page."""
-    from ..db import crud
+    from llamacontroller.db import crud
     
     # Get user's tokens
     tokens = crud.get_user_api_tokens(db, user.id)
@@ -393,7 +396,7 @@ async def create_token_ui(
     db: Session = Depends(get_db)
 ):
     """Create a new API token (HTMX endpoint)."""
-    from ..db import crud
+    from llamacontroller.db import crud
     
     try:
         # Convert expires_days to int if provided and not empty
@@ -459,7 +462,7 @@ async def delete_token_ui(
     db: Session = Depends(get_db)
 ):
     """Delete an API token (HTMX endpoint)."""
-    from ..db import crud
+    from llamacontroller.db import crud
     
     try:
         # Get token and verify ownership
@@ -467,8 +470,9 @@ async def delete_token_ui(
         if not token or token.user_id != user.id:
             raise HTTPException(status_code=404, detail="Token not found")
         
-        # Delete token
+        # Delete token (commit now; get_db's exit commit runs after the response)
         crud.delete_api_token(db, token)
+        db.commit()
         
         # Get updated token list
         tokens = crud.get_user_api_tokens(db, user.id)
@@ -13,11 +13,21 @@ sys.path.insert(0, str(project_root / "src"))
 @pytest.fixture(scope="session", autouse=True)
 def setup_test_environment():
     """Set up test environment before running tests."""
-    # Prevent SQLAlchemy table redefinition issues
-    import warnings
-    warnings.filterwarnings("ignore", message=".*already defined.*")
+    # Register the ORM tables once, through the single absolute package
+    # path; a second registration would now surface as an error instead
+    # of a silenced warning
+    import llamacontroller.db.models  # noqa: F401
     
     yield
     
     # Cleanup after tests
     pass
+
+@pytest.fixture(scope="module")
+def loaded_config_manager():
+    """ConfigManager with ./config loaded once per test module (read-only use)."""
+    from llamacontroller.core.config import ConfigManager
+    
+    config_manager = ConfigManager(config_dir="./config")
+    config_manager.load_config()
+    return config_manager
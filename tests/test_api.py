@@ -4,26 +4,28 @@ Tests for API endpoints.
 
 import pytest
 from fastapi.testclient import TestClient
-from unittest.mock import Mock, AsyncMock, patch
+from unittest.mock import MagicMock
 
-from src.llamacontroller.main import app
-from src.llamacontroller.core.lifecycle import ModelLifecycleManager
-from src.llamacontroller.models.lifecycle import (
+from llamacontroller.main import app
+from llamacontroller.core.lifecycle import ModelLifecycleManager
+from llamacontroller.models.lifecycle import (
     ModelStatus,
     ProcessStatus,
     HealthCheckResponse,
     LoadModelResponse,
     UnloadModelResponse,
-    ModelInfo,
+    LocalModelInfo,
 )
 
-# Test client
-client = TestClient(app)
+@pytest.fixture(scope="module")
+def client():
+    """Test client shared by every test in this module."""
+    return TestClient(app)
 
 class TestRootEndpoints:
     """Test root API endpoints."""
     
-    def test_root(self):
+    def test_root(self, client):
         """Test root endpoint returns API information."""
         response = client.get("/")
         assert response.status_code == 200
@@ -32,7 +34,7 @@ class TestRootEndpoints:
         assert data["version"] == "0.1.0"
         assert "endpoints" in data
     
-    def test_health(self):
+    def test_health(self, client):
         """Test health endpoint."""
         response = client.get("/health")
         assert response.status_code == 200
@@ -42,15 +44,19 @@ class TestRootEndpoints:
 class TestManagementAPI:
     """Test management API endpoints."""
     
-    @pytest.fixture(autouse=True)
-    def setup(self):
-        """Setup test fixtures."""
-        # Mock the lifecycle manager
-        with patch("src.llamacontroller.api.dependencies._lifecycle_manager") as mock_lifecycle:
-            self.mock_lifecycle = mock_lifecycle
-            yield
+    @pytest.fixture(autouse=True, scope="class")
+    def setup(self, request):
+        """Mock the lifecycle manager once for the whole class."""
+        monkeypatch = pytest.MonkeyPatch()
+        request.cls.mock_lifecycle = MagicMock()
+        monkeypatch.setattr(
+            "llamacontroller.api.dependencies._lifecycle_manager",
+            request.cls.mock_lifecycle,
+        )
+        yield
+        monkeypatch.undo()
     
-    def test_list_models_empty(self):
+    def test_list_models_empty(self, client):
         """Test listing models when none are configured."""
         self.mock_lifecycle.get_available_models.return_value = []
         
@@ -60,10 +66,10 @@ class TestManagementAPI:
         assert "models" in data
         assert len(data["models"]) == 0
     
-    def test_list_models_with_models(self):
+    def test_list_models_with_models(self, client):
         """Test listing models when models are configured."""
         mock_models = [
-            ModelInfo(
+            LocalModelInfo(
                 id="test-model",
                 name="Test Model",
                 path="/path/to/model.gguf",
@@ -82,7 +88,7 @@ class TestManagementAPI:
         assert len(data["models"]) == 1
         assert data["models"][0]["id"] == "test-model"
     
-    def test_get_model_status_no_model_loaded(self):
+    def test_get_model_status_no_model_loaded(self, client):
         """Test getting status when no model is loaded."""
         mock_status = ModelStatus(
             model_id=None,
@@ -108,7 +114,7 @@ class TestManagementAPI:
         assert data["model_id"] is None
         assert data["status"] == "stopped"
     
-    def test_health_check(self):
+    def test_health_check(self, client):
         """Test health check endpoint."""
         mock_health = HealthCheckResponse(
             healthy=True,
@@ -131,17 +137,22 @@ class TestManagementAPI:
 class TestOllamaAPI:
     """Test Ollama-compatible API endpoints."""
     
-    @pytest.fixture(autouse=True)
-    def setup(self):
-        """Setup test fixtures."""
-        with patch("src.llamacontroller.api.dependencies._lifecycle_manager") as mock_lifecycle:
-            self.mock_lifecycle = mock_lifecycle
-            yield
+    @pytest.fixture(autouse=True, scope="class")
+    def setup(self, request):
+        """Mock the lifecycle manager once for the whole class."""
+        monkeypatch = pytest.MonkeyPatch()
+        request.cls.mock_lifecycle = MagicMock()
+        monkeypatch.setattr(
+            "llamacontroller.api.dependencies._lifecycle_manager",
+            request.cls.mock_lifecycle,
+        )
+        yield
+        monkeypatch.undo()
     
-    def test_list_models_tags_endpoint(self):
+    def test_list_models_tags_endpoint(self, client):
         """Test Ollama /api/tags endpoint."""
         mock_models = [
-            ModelInfo(
+            LocalModelInfo(
                 id="phi-4",
                 name="Phi-4",
                 path="/path/to/phi4.gguf",
@@ -160,14 +171,14 @@ class TestOllamaAPI:
         assert "models" in data
         assert len(data["models"]) >= 0  # May be empty if path doesn't exist
     
-    def test_show_model_not_found(self):
+    def test_show_model_not_found(self, client):
         """Test show model when model doesn't exist."""
         self.mock_lifecycle.config_manager.models.get_model.return_value = None
         
         response = client.post("/api/show", json={"name": "nonexistent-model"})
         assert response.status_code == 404
     
-    def test_list_running_models_none(self):
+    def test_list_running_models_none(self, client):
         """Test /api/ps when no model is running."""
         self.mock_lifecycle.get_current_model.return_value = None
         
@@ -177,7 +188,7 @@ class TestOllamaAPI:
         assert "models" in data
         assert len(data["models"]) == 0
     
-    def test_delete_model_not_supported(self):
+    def test_delete_model_not_supported(self, client):
         """Test that delete endpoint returns not implemented."""
         response = client.request(
             "DELETE",
@@ -191,7 +202,7 @@ class TestOllamaAPI:
 class TestAPIIntegration:
     """Integration tests for API."""
     
-    def test_openapi_docs_available(self):
+    def test_openapi_docs_available(self, client):
         """Test that OpenAPI documentation is available."""
         response = client.get("/openapi.json")
         assert response.status_code == 200
@@ -199,7 +210,7 @@ class TestAPIIntegration:
         assert "openapi" in data
         assert "paths" in data
     
-    def test_docs_ui_available(self):
+    def test_docs_ui_available(self, client):
         """Test that Swagger UI is available."""
         response = client.get("/docs")
         assert response.status_code == 200
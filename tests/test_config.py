@@ -4,10 +4,9 @@ Unit tests for configuration management.
 These tests validate the configuration loading and validation logic.
 """
 
+import sys
 import pytest
 from pathlib import Path
-import tempfile
-import yaml
 
 from llamacontroller.core.config import ConfigManager, ConfigError
 from llamacontroller.models.config import (
@@ -31,23 +30,20 @@ class TestConfigManager:
         with pytest.raises(ConfigError, match="Configuration directory not found"):
             ConfigManager(config_dir="./nonexistent")
     
-    def test_load_yaml_file_success(self):
+    def test_load_yaml_file_success(self, loaded_config_manager):
         """Test loading a valid YAML file."""
-        config_manager = ConfigManager(config_dir="./config")
-        data = config_manager.load_yaml_file("llamacpp-config.yaml")
+        data = loaded_config_manager.load_yaml_file("llamacpp-config.yaml")
         assert isinstance(data, dict)
         assert "llama_cpp" in data
     
-    def test_load_yaml_file_not_found(self):
+    def test_load_yaml_file_not_found(self, loaded_config_manager):
         """Test loading a non-existent YAML file."""
-        config_manager = ConfigManager(config_dir="./config")
         with pytest.raises(ConfigError, match="Configuration file not found"):
-            config_manager.load_yaml_file("nonexistent.yaml")
+            loaded_config_manager.load_yaml_file("nonexistent.yaml")
     
-    def test_load_llama_cpp_config(self):
+    def test_load_llama_cpp_config(self, loaded_config_manager):
         """Test loading llama.cpp configuration."""
-        config_manager = ConfigManager(config_dir="./config")
-        llama_config = config_manager.load_llama_cpp_config()
+        llama_config = loaded_config_manager.load_llama_cpp_config()
         
         assert isinstance(llama_config, LlamaCppConfig)
         assert llama_config.default_host == "127.0.0.1"
@@ -55,10 +51,9 @@ class TestConfigManager:
         assert llama_config.log_level == "info"
         assert llama_config.restart_on_crash is True
     
-    def test_load_models_config(self):
+    def test_load_models_config(self, loaded_config_manager):
         """Test loading models configuration."""
-        config_manager = ConfigManager(config_dir="./config")
-        models_config = config_manager.load_models_config()
+        models_config = loaded_config_manager.load_models_config()
         
         assert isinstance(models_config, ModelsConfig)
         assert len(models_config.models) >= 2
@@ -71,10 +66,9 @@ class TestConfigManager:
         # Parameters may be in cli_params instead of direct fields
         assert phi4.parameters is not None
     
-    def test_load_auth_config(self):
+    def test_load_auth_config(self, loaded_config_manager):
         """Test loading authentication configuration."""
-        config_manager = ConfigManager(config_dir="./config")
-        auth_config = config_manager.load_auth_config()
+        auth_config = loaded_config_manager.load_auth_config()
         
         assert isinstance(auth_config, AuthConfig)
         assert auth_config.session_timeout == 3600
@@ -82,10 +76,9 @@ class TestConfigManager:
         assert len(auth_config.users) == 1
         assert auth_config.users[0].username == "admin"
     
-    def test_load_config_integration(self):
+    def test_load_config_integration(self, loaded_config_manager):
         """Test loading all configurations together."""
-        config_manager = ConfigManager(config_dir="./config")
-        config = config_manager.load_config()
+        config = loaded_config_manager.get_config()
         
         # Verify all components loaded
         assert config.llama_cpp is not None
@@ -93,9 +86,9 @@ class TestConfigManager:
         assert config.auth is not None
         
         # Verify can access via properties
-        assert config_manager.llama_cpp.default_port == 8080
-        assert len(config_manager.models.models) == 2
-        assert len(config_manager.auth.users) == 1
+        assert loaded_config_manager.llama_cpp.default_port == 8080
+        assert len(loaded_config_manager.models.models) == 2
+        assert len(loaded_config_manager.auth.users) == 1
     
     def test_get_config_before_load(self):
         """Test getting config before loading."""
@@ -103,12 +96,9 @@ class TestConfigManager:
         with pytest.raises(ConfigError, match="Configuration not loaded"):
             config_manager.get_config()
     
-    def test_validate_config(self):
+    def test_validate_config(self, loaded_config_manager):
         """Test configuration validation."""
-        config_manager = ConfigManager(config_dir="./config")
-        config_manager.load_config()
-        
-        warnings = config_manager.validate_config()
+        warnings = loaded_config_manager.validate_config()
         
         # Should have warning about weak password
         assert len(warnings) > 0
@@ -128,27 +118,24 @@ class TestConfigManager:
 class TestModelsConfig:
     """Test ModelsConfig class."""
     
-    def test_get_model_by_id(self):
+    def test_get_model_by_id(self, loaded_config_manager):
         """Test retrieving model by ID."""
-        config_manager = ConfigManager(config_dir="./config")
-        models_config = config_manager.load_models_config()
+        models_config = loaded_config_manager.models
         
         model = models_config.get_model("phi-4-reasoning")
         assert model is not None
         assert model.id == "phi-4-reasoning"
     
-    def test_get_nonexistent_model(self):
+    def test_get_nonexistent_model(self, loaded_config_manager):
         """Test retrieving non-existent model."""
-        config_manager = ConfigManager(config_dir="./config")
-        models_config = config_manager.load_models_config()
+        models_config = loaded_config_manager.models
         
         model = models_config.get_model("nonexistent")
         assert model is None
     
-    def test_get_model_ids(self):
+    def test_get_model_ids(self, loaded_config_manager):
         """Test getting all model IDs."""
-        config_manager = ConfigManager(config_dir="./config")
-        models_config = config_manager.load_models_config()
+        models_config = loaded_config_manager.models
         
         ids = models_config.get_model_ids()
         assert len(ids) == 2
@@ -159,20 +146,18 @@ class TestModelsConfig:
 class TestAuthConfig:
     """Test AuthConfig class."""
     
-    def test_get_user_by_username(self):
+    def test_get_user_by_username(self, loaded_config_manager):
         """Test retrieving user by username."""
-        config_manager = ConfigManager(config_dir="./config")
-        auth_config = config_manager.load_auth_config()
+        auth_config = loaded_config_manager.auth
         
         user = auth_config.get_user("admin")
         assert user is not None
         assert user.username == "admin"
         assert user.role == "admin"
     
-    def test_get_nonexistent_user(self):
+    def test_get_nonexistent_user(self, loaded_config_manager):
         """Test retrieving non-existent user."""
-        config_manager = ConfigManager(config_dir="./config")
-        auth_config = config_manager.load_auth_config()
+        auth_config = loaded_config_manager.auth
         
         user = auth_config.get_user("nonexistent")
         assert user is None
@@ -181,27 +166,46 @@ class TestAuthConfig:
 class TestConfigValidation:
     """Test configuration validation with invalid data."""
     
-    def test_invalid_yaml_syntax(self):
+    def test_invalid_yaml_syntax(self, tmp_path):
         """Test loading YAML with syntax errors."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create invalid YAML file
-            config_file = Path(tmpdir) / "invalid.yaml"
-            config_file.write_text("invalid: yaml: : syntax")
-            
-            config_manager = ConfigManager(config_dir=tmpdir)
-            with pytest.raises(ConfigError, match="Failed to parse YAML"):
-                config_manager.load_yaml_file("invalid.yaml")
-    
-    def test_empty_yaml_file(self):
+        # Create invalid YAML file
+        (tmp_path / "invalid.yaml").write_bytes(b"invalid: yaml: : syntax")
+        
+        config_manager = ConfigManager(config_dir=str(tmp_path))
+        with pytest.raises(ConfigError, match="Failed to parse YAML"):
+            config_manager.load_yaml_file("invalid.yaml")
+    
+    def test_empty_yaml_file(self, tmp_path):
         """Test loading empty YAML file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create empty YAML file
-            config_file = Path(tmpdir) / "empty.yaml"
-            config_file.write_text("")
-            
-            config_manager = ConfigManager(config_dir=tmpdir)
-            with pytest.raises(ConfigError, match="Configuration file is empty"):
-                config_manager.load_yaml_file("empty.yaml")
+        # Create empty YAML file
+        (tmp_path / "empty.yaml").write_bytes(b"")
+        
+        config_manager = ConfigManager(config_dir=str(tmp_path))
+        with pytest.raises(ConfigError, match="Configuration file is empty"):
+            config_manager.load_yaml_file("empty.yaml")
+    
+    def test_out_of_range_port_rejected(self, tmp_path):
+        """Test that an out-of-range port is rejected."""
+        (tmp_path / "llamacpp-config.yaml").write_text(
+            "llama_cpp:\n"
+            f"  executable_path: {sys.executable!r}\n"
+            "  default_port: 70000\n",
+            encoding="utf-8",
+        )
+        
+        config_manager = ConfigManager(config_dir=str(tmp_path))
+        with pytest.raises(ConfigError, match="Invalid llama.cpp configuration"):
+            config_manager.load_llama_cpp_config()
+    
+    def test_unknown_key_rejected(self, tmp_path):
+        """Test that a misspelled config key is rejected instead of ignored."""
+        (tmp_path / "auth-config.yaml").write_bytes(
+            b"authentication:\n  session_timeot: 600\n"
+        )
+        
+        config_manager = ConfigManager(config_dir=str(tmp_path))
+        with pytest.raises(ConfigError, match="session_timeot"):
+            config_manager.load_auth_config()
 
 
 if __name__ == "__main__":
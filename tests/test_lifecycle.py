@@ -18,25 +18,22 @@ from llamacontroller.core.lifecycle import ModelLifecycleManager, LifecycleError
 from llamacontroller.models.lifecycle import ProcessStatus
 
 
+@pytest.fixture(scope="module")
+def lifecycle_manager(loaded_config_manager):
+    """Lifecycle manager shared by the read-only tests in this module."""
+    return ModelLifecycleManager(loaded_config_manager)
+
+
 class TestModelLifecycleManager:
     """Tests for ModelLifecycleManager class."""
     
-    def test_init(self):
+    def test_init(self, lifecycle_manager, loaded_config_manager):
         """Test lifecycle manager initialization."""
-        config_manager = ConfigManager(config_dir="./config")
-        config_manager.load_config()
-        
-        lifecycle_manager = ModelLifecycleManager(config_manager)
-        
-        assert lifecycle_manager.config_manager == config_manager
+        assert lifecycle_manager.config_manager == loaded_config_manager
         assert lifecycle_manager.get_current_model() is None
     
-    def test_get_available_models(self):
+    def test_get_available_models(self, lifecycle_manager):
         """Test getting list of available models."""
-        config_manager = ConfigManager(config_dir="./config")
-        config_manager.load_config()
-        
-        lifecycle_manager = ModelLifecycleManager(config_manager)
         models = lifecycle_manager.get_available_models()
         
         assert len(models) > 0
@@ -44,25 +41,16 @@ class TestModelLifecycleManager:
         assert all(hasattr(m, 'name') for m in models)
         assert all(m.loaded is False for m in models)
     
-    def test_get_model_ids(self):
+    def test_get_model_ids(self, lifecycle_manager):
         """Test getting list of model IDs."""
-        config_manager = ConfigManager(config_dir="./config")
-        config_manager.load_config()
-        
-        lifecycle_manager = ModelLifecycleManager(config_manager)
         model_ids = lifecycle_manager.get_model_ids()
         
         assert len(model_ids) > 0
         assert isinstance(model_ids, list)
         assert all(isinstance(id, str) for id in model_ids)
     
-    @pytest.mark.asyncio
-    async def test_get_status_no_model(self):
+    async def test_get_status_no_model(self, lifecycle_manager):
         """Test getting status when no model is loaded."""
-        config_manager = ConfigManager(config_dir="./config")
-        config_manager.load_config()
-        
-        lifecycle_manager = ModelLifecycleManager(config_manager)
         status = await lifecycle_manager.get_status()
         
         assert status.model_id is None
@@ -70,48 +58,31 @@ class TestModelLifecycleManager:
         assert status.status == ProcessStatus.STOPPED
         assert status.pid is None
     
-    @pytest.mark.asyncio
-    async def test_healthcheck_no_server(self):
+    async def test_healthcheck_no_server(self, lifecycle_manager):
         """Test healthcheck when server is not running."""
-        config_manager = ConfigManager(config_dir="./config")
-        config_manager.load_config()
-        
-        lifecycle_manager = ModelLifecycleManager(config_manager)
         health = await lifecycle_manager.healthcheck()
         
         assert health.healthy is False
         assert health.status == ProcessStatus.STOPPED
     
-    @pytest.mark.asyncio
-    async def test_load_model_not_found(self):
+    async def test_load_model_not_found(self, loaded_config_manager):
         """Test loading a model that doesn't exist."""
-        config_manager = ConfigManager(config_dir="./config")
-        config_manager.load_config()
-        
-        lifecycle_manager = ModelLifecycleManager(config_manager)
+        lifecycle_manager = ModelLifecycleManager(loaded_config_manager)
         
         with pytest.raises(LifecycleError, match="Model not found"):
             await lifecycle_manager.load_model("nonexistent-model")
     
-    @pytest.mark.asyncio
-    async def test_unload_model_when_none_loaded(self):
+    async def test_unload_model_when_none_loaded(self, loaded_config_manager):
         """Test unloading when no model is loaded."""
-        config_manager = ConfigManager(config_dir="./config")
-        config_manager.load_config()
-        
-        lifecycle_manager = ModelLifecycleManager(config_manager)
+        lifecycle_manager = ModelLifecycleManager(loaded_config_manager)
         
         # Multi-GPU version requires gpu_id, but should handle gracefully
         # Just verify the manager is initialized properly
         current = lifecycle_manager.get_current_model()
         assert current is None
     
-    def test_get_current_model_none(self):
+    def test_get_current_model_none(self, lifecycle_manager):
         """Test getting current model when none is loaded."""
-        config_manager = ConfigManager(config_dir="./config")
-        config_manager.load_config()
-        
-        lifecycle_manager = ModelLifecycleManager(config_manager)
         current = lifecycle_manager.get_current_model()
         
         assert current is None
@@ -121,7 +92,6 @@ class TestModelLifecycleManagerIntegration:
     """Integration tests that actually start llama-server (optional)."""
     
     @pytest.mark.skip(reason="Requires actual llama-server and model files")
-    @pytest.mark.asyncio
     async def test_load_model_real(self):
         """Test loading a real model (requires llama-server)."""
         config_manager = ConfigManager(config_dir="./config")
@@ -157,7 +127,6 @@ class TestModelLifecycleManagerIntegration:
             await lifecycle_manager.unload_model()
     
     @pytest.mark.skip(reason="Requires actual llama-server and model files")
-    @pytest.mark.asyncio
     async def test_switch_model_real(self):
         """Test switching between models (requires llama-server)."""
         config_manager = ConfigManager(config_dir="./config")